@@ -0,0 +1,117 @@
+"""Benchmark the local hashing embedding backend against the remote model.
+
+For every job, ranks all resumes by cosine similarity with both backends
+and reports Spearman rank correlation, top-1 agreement and per-text
+latency. The remote side needs EMBEDDING_MODEL credentials; its vectors go
+through the embedding cache, so repeat runs only pay for the local side.
+
+Corpus: a directory with jobs/*.txt and resumes/*.txt (defaults to a small
+built-in sample).
+
+Usage:
+  uv run python scripts/bench_embeddings.py
+  uv run python scripts/bench_embeddings.py --corpus data/bench --dims 1024
+  uv run python scripts/bench_embeddings.py --local-only    # latency only
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from pathlib import Path
+
+from scipy.stats import spearmanr
+
+from hr_breaker.config import get_settings
+from hr_breaker.services.embeddings import (
+    HashingEmbeddingBackend,
+    LiteLLMEmbeddingBackend,
+)
+from hr_breaker.utils.similarity import similarity_matrix
+
+SAMPLE_JOBS = {
+    "backend": "Senior backend engineer. Python, Django, PostgreSQL, REST APIs, "
+    "Kafka, Kubernetes on AWS, CI/CD, observability.",
+    "data": "Data scientist. Python, pandas, scikit-learn, experimentation, "
+    "A/B testing, SQL, causal inference, dashboards for product teams.",
+    "frontend": "Frontend engineer. TypeScript, React, Next.js, accessibility, "
+    "design systems, performance budgets, end-to-end testing with Playwright.",
+    "devops": "Site reliability engineer. Terraform, Kubernetes, Prometheus, "
+    "Grafana, incident response, on-call, Linux, networking, Go tooling.",
+}
+
+SAMPLE_RESUMES = {
+    "django_dev": "Backend developer, 6 years. Built Django REST services on "
+    "PostgreSQL, event pipelines with Kafka, deployed on EKS with GitHub Actions.",
+    "ml_analyst": "Analyst turned data scientist. Ran A/B tests, built churn "
+    "models in scikit-learn, wrote SQL and pandas notebooks, Looker dashboards.",
+    "react_dev": "UI engineer. React and TypeScript component libraries, "
+    "Storybook design system, Lighthouse performance work, Playwright suites.",
+    "sre": "SRE. Terraform modules for AWS, Kubernetes operators in Go, "
+    "Prometheus alerting, Grafana dashboards, led incident postmortems.",
+    "fullstack": "Full-stack engineer. Node.js and React, some Python APIs, "
+    "PostgreSQL, Docker, deployed to Heroku and later Kubernetes.",
+    "pm": "Product manager. Roadmaps, stakeholder interviews, OKRs, worked "
+    "with data science on experiments, launched mobile onboarding flow.",
+}
+
+
+def load_corpus(path: Path | None) -> tuple[dict[str, str], dict[str, str]]:
+    if path is None:
+        return SAMPLE_JOBS, SAMPLE_RESUMES
+
+    def read(sub: str) -> dict[str, str]:
+        return {p.stem: p.read_text(encoding="utf-8") for p in sorted((path / sub).glob("*.txt"))}
+
+    return read("jobs"), read("resumes")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", type=Path, default=None, help="dir with jobs/ and resumes/")
+    parser.add_argument("--dims", type=int, default=None, help="local backend dimensions")
+    parser.add_argument("-n", type=int, default=50, help="timing runs")
+    parser.add_argument("--local-only", action="store_true", help="skip the remote model")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    jobs, resumes = load_corpus(args.corpus)
+    job_texts, resume_texts = list(jobs.values()), list(resumes.values())
+    local = HashingEmbeddingBackend(args.dims or settings.embedding_output_dimensionality)
+
+    samples = []
+    for _ in range(args.n):
+        start = time.perf_counter()
+        local.embed_sync(resume_texts)
+        samples.append((time.perf_counter() - start) / len(resume_texts))
+    print(f"local: {statistics.median(samples) * 1e6:.0f} us/text ({local.dimensions} dims)")
+
+    if args.local_only:
+        return
+
+    remote = LiteLLMEmbeddingBackend(
+        settings.embedding_model, settings.embedding_output_dimensionality
+    )
+    start = time.perf_counter()
+    remote_vectors = asyncio.run(remote.embed(job_texts + resume_texts))
+    print(f"remote: {(time.perf_counter() - start) * 1e3:.0f} ms for {len(remote_vectors)} texts")
+
+    local_vectors = local.embed_sync(job_texts + resume_texts)
+    split = len(job_texts)
+    remote_sim = similarity_matrix(remote_vectors[:split], remote_vectors[split:])
+    local_sim = similarity_matrix(local_vectors[:split], local_vectors[split:])
+
+    print(f"\n{'job':<20} {'spearman':>9} {'top-1 remote':>16} {'top-1 local':>16}")
+    names = list(resumes)
+    rhos, agree = [], 0
+    for job_name, r_row, l_row in zip(jobs, remote_sim, local_sim):
+        rho = spearmanr(r_row, l_row).statistic
+        rhos.append(rho)
+        top_remote, top_local = names[int(r_row.argmax())], names[int(l_row.argmax())]
+        agree += top_remote == top_local
+        print(f"{job_name:<20} {rho:>9.2f} {top_remote:>16} {top_local:>16}")
+    print(f"\nmean spearman {statistics.mean(rhos):.2f}, top-1 agreement {agree}/{len(rhos)}")
+
+
+if __name__ == "__main__":
+    main()
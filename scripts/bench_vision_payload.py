@@ -0,0 +1,105 @@
+"""Benchmark vision payload size against review quality.
+
+Rasterizes the first page of a resume PDF with several image settings and
+reports image size, base64 payload size and encode time. With --job, each
+variant is also sent to the combined reviewer so scores and visual issues can
+be compared against the PNG baseline.
+
+Usage:
+  uv run python scripts/bench_vision_payload.py output/resume.pdf
+  uv run python scripts/bench_vision_payload.py output/resume.pdf --job job.txt
+"""
+
+import argparse
+import asyncio
+import base64
+import time
+from pathlib import Path
+
+import fitz
+
+from hr_breaker.config import get_settings
+from hr_breaker.models import JobPosting, OptimizedResume, RenderResult
+from hr_breaker.services.pdf_parser import extract_text_from_pdf_bytes
+from hr_breaker.services.render_artifacts import RenderArtifacts, rasterize_page
+
+# (label, dpi, format, quality, grayscale, max_dim)
+VARIANTS = [
+    ("png 144dpi (default)", 144, "png", 85, False, 0),
+    ("png 144dpi gray", 144, "png", 85, True, 0),
+    ("png 96dpi", 96, "png", 85, False, 0),
+    ("jpeg 144dpi q85", 144, "jpeg", 85, False, 0),
+    ("jpeg 144dpi q70 gray", 144, "jpeg", 70, True, 0),
+    ("webp 144dpi q85", 144, "webp", 85, False, 0),
+    ("webp 144dpi q75 gray", 144, "webp", 75, True, 0),
+    ("webp q80 max 1024px", 144, "webp", 80, False, 1024),
+]
+
+
+def measure_payloads(page: "fitz.Page") -> None:
+    baseline = None
+    print(f"{'variant':<24} {'image':>10} {'base64':>10} {'vs png':>8} {'encode':>9}")
+    for label, dpi, fmt, quality, grayscale, max_dim in VARIANTS:
+        start = time.perf_counter()
+        image = rasterize_page(
+            page, dpi=dpi, fmt=fmt, quality=quality, grayscale=grayscale, max_dim=max_dim
+        )
+        encoded = base64.b64encode(image)
+        elapsed = (time.perf_counter() - start) * 1000
+        baseline = baseline or len(encoded)
+        print(
+            f"{label:<24} {len(image) / 1024:8.1f}KB {len(encoded) / 1024:8.1f}KB "
+            f"{len(encoded) / baseline:8.0%} {elapsed:7.1f}ms"
+        )
+
+
+async def review_variants(pdf_bytes: bytes, page_count: int, job_text: str) -> None:
+    from hr_breaker.agents.combined_reviewer import combined_review, compute_ats_score
+
+    settings = get_settings()
+    job = JobPosting(title="", company="", raw_text=job_text)
+    pdf_text = extract_text_from_pdf_bytes(pdf_bytes)
+
+    print(f"\n{'variant':<24} {'prof':>5} {'ats':>6} {'issues':>7}")
+    for label, dpi, fmt, quality, grayscale, max_dim in VARIANTS:
+        settings.vision_image_dpi = dpi
+        settings.vision_image_format = fmt
+        settings.vision_image_quality = quality
+        settings.vision_image_grayscale = grayscale
+        settings.vision_image_max_dim = max_dim
+
+        artifacts = RenderArtifacts.from_result(
+            RenderResult(pdf_bytes=pdf_bytes, page_count=page_count)
+        )
+        optimized = OptimizedResume(
+            source_checksum="bench", pdf_text=pdf_text, artifacts=artifacts
+        )
+        result, _, _, _ = await combined_review(optimized, job)
+        print(
+            f"{label:<24} {str(result.looks_professional):>5} "
+            f"{compute_ats_score(result):6.2f} {len(result.visual_issues):7d}"
+        )
+        for issue in result.visual_issues:
+            print(f"    - {issue}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pdf", type=Path, help="rendered resume PDF")
+    parser.add_argument("--job", type=Path, help="job posting text; runs the reviewer per variant")
+    args = parser.parse_args()
+
+    pdf_bytes = args.pdf.read_bytes()
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        page_count = len(doc)
+        measure_payloads(doc[0])
+    finally:
+        doc.close()
+
+    if args.job:
+        asyncio.run(review_variants(pdf_bytes, page_count, args.job.read_text()))
+
+
+if __name__ == "__main__":
+    main()
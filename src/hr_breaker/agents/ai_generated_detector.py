@@ -1,4 +1,5 @@
 from datetime import date
+from functools import lru_cache
 
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
@@ -69,6 +70,7 @@ When listing indicators, quote specific problematic text.
 """
 
 
+@lru_cache
 def get_ai_generated_agent() -> Agent:
     agent = Agent(
         get_flash_model(),
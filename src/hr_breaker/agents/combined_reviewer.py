@@ -7,7 +7,9 @@ from pydantic_ai import Agent, BinaryContent
 
 from hr_breaker.config import get_flash_model, get_model_settings
 from hr_breaker.models import JobPosting, OptimizedResume
-from hr_breaker.services.renderer import get_renderer, RenderError
+from hr_breaker.services.render_artifacts import ensure_artifacts, rasterize_page
+from hr_breaker.services.renderer import RenderError
+from hr_breaker.utils.prompt_cache import cacheable_prompt
 from hr_breaker.utils.retry import run_with_retry
 
 
@@ -154,16 +156,14 @@ def get_combined_reviewer_agent() -> Agent:
 
 
 def pdf_to_image(pdf_bytes: bytes) -> tuple[bytes, int]:
-    """Convert first page of PDF to PNG bytes.
+    """Convert first page of PDF to image bytes (VISION_IMAGE_* settings).
 
     Returns (image_bytes, page_count).
     """
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
     try:
         page_count = len(doc)
-        page = doc[0]
-        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))
-        return pix.tobytes("png"), page_count
+        return rasterize_page(doc[0]), page_count
     finally:
         doc.close()
 
@@ -179,20 +179,15 @@ async def combined_review(
         job: Job posting to match against
 
     Returns (result, pdf_bytes, page_count, render_warnings).
-    pdf_bytes is None if rendering failed.
+    pdf_bytes is None if rendering failed, page_count is 0 if the page could
+    not be converted to an image.
     """
-    renderer = get_renderer()
-
-    # Render PDF
-    content = optimized.html if optimized.html is not None else optimized.data
+    # Reuse the orchestration's render; only re-render if it is missing
     try:
-        if isinstance(content, str):
-            render_result = renderer.render(content)
-        else:
-            render_result = renderer.render_data(content)
-        pdf_bytes = render_result.pdf_bytes
-        render_warnings = render_result.warnings
-        page_count = render_result.page_count
+        artifacts = await ensure_artifacts(optimized)
+        pdf_bytes = artifacts.pdf_bytes
+        render_warnings = artifacts.warnings
+        page_count = artifacts.page_count
     except RenderError as e:
         return (
             CombinedReviewResult(
@@ -213,7 +208,7 @@ async def combined_review(
 
     # Convert to image
     try:
-        image_bytes, page_count = pdf_to_image(pdf_bytes)
+        image_bytes = artifacts.page_image()
     except Exception as e:
         return (
             CombinedReviewResult(
@@ -231,6 +226,10 @@ async def combined_review(
             0,
             render_warnings,
         )
+    finally:
+        if artifacts is not optimized.artifacts:
+            # Rendered just for this review; no one else reuses the document
+            artifacts.close()
 
     # Get resume text for ATS evaluation
     if optimized.pdf_text:
@@ -242,8 +241,8 @@ async def combined_review(
     else:
         resume_text = "(no content)"
 
-    # Build prompt with both image and text
-    prompt = f"""COMBINED RESUME REVIEW
+    # Build prompt with both image and text; the job part is the same every iteration
+    prefix = f"""COMBINED RESUME REVIEW
 
 === JOB POSTING ===
 Position: {job.title}
@@ -253,7 +252,8 @@ Company: {job.company}
 
 Required Skills: {', '.join(job.requirements)}
 Keywords: {', '.join(job.keywords)}
-
+"""
+    prompt = f"""
 === RESUME TEXT (for ATS evaluation) ===
 {resume_text}
 
@@ -266,10 +266,11 @@ Perform BOTH visual quality check AND ATS screening. Return all fields.
     agent = get_combined_reviewer_agent()
     result = await run_with_retry(
         agent.run,
-        [
+        cacheable_prompt(
+            prefix,
             prompt,
-            BinaryContent(data=image_bytes, media_type="image/png"),
-        ],
+            BinaryContent(data=image_bytes, media_type=artifacts.page_image_media_type),
+        ),
     )
 
     return result.output, pdf_bytes, page_count, render_warnings
@@ -1,10 +1,12 @@
 from datetime import date
+from functools import lru_cache
 
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 
 from hr_breaker.config import get_model_settings, get_pro_model
 from hr_breaker.models import FilterResult, OptimizedResume, ResumeSource
+from hr_breaker.utils.prompt_cache import cacheable_prompt
 from hr_breaker.utils.retry import run_with_retry
 
 
@@ -86,6 +88,7 @@ BLOCK (score below 0.5):
 """
 
 
+@lru_cache
 def get_hallucination_agent(no_shame: bool = False) -> Agent:
     prompt = LENIENT_PROMPT if no_shame else STRICT_PROMPT
     agent = Agent(
@@ -116,19 +119,20 @@ async def detect_hallucinations(
     else:
         optimized_content = "(no content)"
 
-    prompt = f"""Compare these two resumes and score the optimized version for hallucinations.
+    # Original resume and instructions first: identical on every iteration
+    prefix = f"""Compare these two resumes and score the optimized version for hallucinations.
 
 === ORIGINAL RESUME (source of truth, may include commented-out content which is valid) ===
 {source.content}
 """
 
     if source.instructions:
-        prompt += f"""
+        prefix += f"""
 === USER INSTRUCTIONS (also source of truth - the user provided these extra details/instructions) ===
 {source.instructions}
 """
 
-    prompt += f"""
+    prompt = f"""
 === OPTIMIZED RESUME (check for fabrication) ===
 {optimized_content}
 
@@ -139,7 +143,7 @@ List any concerns but remember: light assumptions about related technologies are
 
     threshold = 0.6 if no_shame else 0.9
     agent = get_hallucination_agent(no_shame=no_shame)
-    result = await run_with_retry(agent.run, prompt)
+    result = await run_with_retry(agent.run, cacheable_prompt(prefix, prompt))
     r = result.output
 
     issues = []
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic import BaseModel
 from pydantic_ai import Agent
 
@@ -22,15 +24,20 @@ Ignore formatting commands - extract the actual name text only.
 """
 
 
-async def extract_name(content: str) -> tuple[str | None, str | None]:
-    """Extract first and last name from resume content using LLM."""
-    settings = get_settings()
-    agent = Agent(
+@lru_cache
+def get_name_extractor_agent() -> Agent:
+    return Agent(
         get_flash_model(),
         output_type=ExtractedName,
         system_prompt=SYSTEM_PROMPT,
         model_settings=get_model_settings(),
     )
+
+
+async def extract_name(content: str) -> tuple[str | None, str | None]:
+    """Extract first and last name from resume content using LLM."""
+    settings = get_settings()
+    agent = get_name_extractor_agent()
     # Only send first N chars - name should be at the top
     snippet = content[:settings.agent_name_extractor_chars]
     result = await run_with_retry(agent.run, f"Extract the name from this resume:\n\n{snippet}")
@@ -1,12 +1,17 @@
 import logging
+from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import BaseModel
-from pydantic_ai import Agent, BinaryContent
+from pydantic_ai import Agent, BinaryContent, RunContext
 
-from hr_breaker.agents.combined_reviewer import pdf_to_image
-from hr_breaker.config import get_model_settings, get_pro_model, get_settings
+from hr_breaker.config import (
+    get_model_settings,
+    get_pro_model,
+    get_settings,
+)
 from hr_breaker.filters.data_validator import validate_html
 from hr_breaker.filters.keyword_matcher import check_keywords
 from hr_breaker.models import (
@@ -16,8 +21,10 @@ from hr_breaker.models import (
     ResumeSource,
 )
 from hr_breaker.services.length_estimator import estimate_content_length
-from hr_breaker.services.renderer import HTMLRenderer, RenderError
+from hr_breaker.services.render_artifacts import RenderArtifacts
+from hr_breaker.services.renderer import RenderError, get_renderer
 from hr_breaker.utils import extract_text_from_html
+from hr_breaker.utils.prompt_cache import cacheable_prompt
 from hr_breaker.utils.retry import run_with_retry
 
 logger = logging.getLogger(__name__)
@@ -25,8 +32,9 @@ logger = logging.getLogger(__name__)
 TEMPLATE_DIR = Path(__file__).parent.parent.parent.parent / "templates"
 
 
+@lru_cache
 def _load_resume_guide() -> str:
-    """Load the HTML generation guide for the optimizer."""
+    """Load the HTML generation guide for the optimizer (read once per process)."""
     guide_path = TEMPLATE_DIR / "resume_guide.md"
     return guide_path.read_text()
 
@@ -120,10 +128,17 @@ class OptimizerResult(BaseModel):
     changes: list[str]
 
 
-def get_optimizer_agent(
-    job: JobPosting, source: ResumeSource, no_shame: bool = False
-) -> Agent:
-    """Create optimizer agent with job/source context for filter tools."""
+@dataclass
+class OptimizerDeps:
+    """Per-run context for the optimizer tools."""
+
+    job: JobPosting
+    source: ResumeSource
+
+
+@lru_cache
+def get_optimizer_agent(no_shame: bool = False) -> Agent[OptimizerDeps, OptimizerResult]:
+    """Optimizer agent, built once per mode; job/source come in as OptimizerDeps."""
     settings = get_settings()
     resume_guide = _load_resume_guide()
     content_rules = OPTIMIZER_LENIENT_RULES if no_shame else OPTIMIZER_STRICT_RULES
@@ -132,6 +147,7 @@ def get_optimizer_agent(
     )
     agent = Agent(
         get_pro_model(),
+        deps_type=OptimizerDeps,
         output_type=OptimizerResult,
         system_prompt=system_prompt,
         model_settings=get_model_settings(),
@@ -142,15 +158,13 @@ def get_optimizer_agent(
         return f"Today's date: {date.today().strftime('%B %Y')}"
 
     @agent.tool_plain
-    def check_content_length(html: str) -> dict:
+    async def check_content_length(html: str) -> dict:
         """Check if HTML content fits one page by rendering PDF. Call before finalizing."""
         est = estimate_content_length(html)
 
-        # Actually render PDF to check real page count
+        # Actually lay out the page to check real page count (no PDF needed)
         try:
-            renderer = HTMLRenderer()
-            render_result = renderer.render(html)
-            page_count = render_result.page_count
+            page_count = (await get_renderer().measure_async(html)).page_count
             fits_one_page = page_count == 1
         except RenderError as e:
             return {
@@ -190,19 +204,28 @@ def get_optimizer_agent(
         return result
 
     @agent.tool_plain
-    def preview_resume(html: str) -> BinaryContent:
+    async def preview_resume(html: str) -> BinaryContent | str:
         """Render HTML to PDF and return preview image. Use to visually check layout."""
         logger.debug("preview_resume called")
-        renderer = HTMLRenderer()
-        result = renderer.render(html)
-        image_bytes, _ = pdf_to_image(result.pdf_bytes)
-        return BinaryContent(data=image_bytes, media_type="image/png")
+        try:
+            result = await get_renderer().render_async(html)
+        except RenderError as e:
+            # Timeouts and sandbox kills end up here; let the model fix the HTML
+            logger.debug("preview_resume render failed: %s", e)
+            return f"Render failed: {e}. Simplify the HTML and try again."
+        artifacts = RenderArtifacts.from_result(result)
+        try:
+            return BinaryContent(
+                data=artifacts.page_image(), media_type=artifacts.page_image_media_type
+            )
+        finally:
+            artifacts.close()
 
-    @agent.tool_plain
-    def check_keywords_tool(html: str) -> dict:
+    @agent.tool
+    def check_keywords_tool(ctx: RunContext[OptimizerDeps], html: str) -> dict:
         """Check keyword coverage vs job posting. Returns missing keywords ranked by TF-IDF importance."""
         resume_text = extract_text_from_html(html)
-        result = check_keywords(resume_text, job)
+        result = check_keywords(resume_text, ctx.deps.job)
         logger.debug(
             "check_keywords called: score=%.2f, missing=%d",
             result.score,
@@ -233,8 +256,13 @@ async def optimize_resume(
     no_shame: bool = False,
     user_instructions: str | None = None,
 ) -> OptimizedResume:
-    """Optimize resume for job posting."""
-    prompt = f"""## Original Resume:
+    """Optimize resume for job posting.
+
+    The prompt starts with what is constant for the whole run (original
+    resume, job, user instructions) so providers can cache that prefix;
+    per-iteration content follows it.
+    """
+    prefix = f"""## Original Resume:
 {context.original_resume}
 
 ## Job Posting:
@@ -246,7 +274,7 @@ Description: {job.description}
 """
 
     if user_instructions:
-        prompt += f"""
+        prefix += f"""
 ## User Instructions:
 {user_instructions}
 
@@ -256,6 +284,7 @@ IMPORTANT: Treat the above "User Instructions" as GROUND TRUTH about the candida
 - These instructions override the "only use original content" rule because they ARE provided by the user.
 """
 
+    prompt = ""
     if context.last_attempt:
         estimate = estimate_content_length(context.last_attempt)
         prompt += f"""
@@ -290,8 +319,12 @@ Return JSON with:
 Output ONLY valid JSON. The html field should contain the raw HTML string.
 """
 
-    agent = get_optimizer_agent(job, source, no_shame=no_shame)
-    result = await run_with_retry(agent.run, prompt)
+    agent = get_optimizer_agent(no_shame=no_shame)
+    result = await run_with_retry(
+        agent.run,
+        cacheable_prompt(prefix, prompt),
+        deps=OptimizerDeps(job=job, source=source),
+    )
     return OptimizedResume(
         html=result.output.html,
         iteration=context.iteration,
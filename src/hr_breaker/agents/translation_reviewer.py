@@ -2,6 +2,7 @@
 
 import logging
 from datetime import date
+from functools import lru_cache
 
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
@@ -77,8 +78,9 @@ class TranslationReview(BaseModel):
     reasoning: str = Field(description="Brief explanation of the score")
 
 
+@lru_cache
 def get_translation_reviewer_agent(language: Language) -> Agent:
-    """Create translation reviewer agent for the given language."""
+    """Translation reviewer agent for the given language, built once per language."""
     prompt = SYSTEM_PROMPT.format(
         language_english=language.english_name,
         language_native=language.native_name,
@@ -2,6 +2,7 @@
 
 import logging
 from datetime import date
+from functools import lru_cache
 
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
@@ -56,8 +57,9 @@ class TranslationResult(BaseModel):
     )
 
 
+@lru_cache
 def get_translator_agent(language: Language) -> Agent:
-    """Create translator agent for the given target language."""
+    """Translator agent for the given target language, built once per language."""
     prompt = SYSTEM_PROMPT.format(
         language_english=language.english_name,
         language_native=language.native_name,
@@ -7,6 +7,7 @@ import click
 
 from hr_breaker.agents import extract_name, parse_job_posting
 from hr_breaker.config import get_settings
+from hr_breaker.filters import FilterRegistry
 from hr_breaker.models import (
     GeneratedPDF,
     ResumeSource,
@@ -16,11 +17,14 @@ from hr_breaker.models import (
 from hr_breaker.orchestration import optimize_for_job
 from hr_breaker.services import (
     PDFStorage,
+    RenderError,
+    ResumeCache,
     scrape_job_posting,
+    warm_up_renderer,
     ScrapingError,
     CloudflareBlockedError,
 )
-from hr_breaker.services.pdf_parser import load_resume_content
+from hr_breaker.services.pdf_parser import ingest_resumes, load_resume_content
 
 
 @click.group()
@@ -59,6 +63,26 @@ OUTPUT_DIR = Path("output")
     help="Run filters sequentially (default: parallel)",
     envvar="HR_BREAKER_SEQ",
 )
+@click.option(
+    "--speculative/--no-speculative",
+    default=None,
+    help="Run local filters first, LLM filters speculatively; cancel on first failure "
+    "(default: FILTER_SPECULATIVE)",
+)
+@click.option(
+    "--filter",
+    "only_filters",
+    multiple=True,
+    metavar="NAME",
+    help="Run only this filter (repeatable; default: all registered filters)",
+)
+@click.option(
+    "--skip-filter",
+    "skip_filters",
+    multiple=True,
+    metavar="NAME",
+    help="Do not run this filter (repeatable)",
+)
 @click.option(
     "--no-shame",
     is_flag=True,
@@ -88,6 +112,9 @@ def optimize(
     max_iterations: int | None,
     debug: bool,
     seq: bool,
+    speculative: bool | None,
+    only_filters: tuple[str, ...],
+    skip_filters: tuple[str, ...],
     no_shame: bool,
     lang: str | None,
     instructions: str | None,
@@ -97,8 +124,28 @@ def optimize(
     RESUME_PATH: Path to resume file (.tex, .md, .txt, .pdf, etc.)
     JOB_INPUT: URL or path to file with job description
     """
+    # Build the filter pipeline first so a typo in a filter name fails fast
+    try:
+        filters = FilterRegistry.pipeline(
+            no_shame=no_shame,
+            enabled=only_filters or None,
+            disabled=skip_filters,
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--filter/--skip-filter")
+    if not len(filters):
+        raise click.BadParameter(
+            "No filters left to run", param_hint="--filter/--skip-filter"
+        )
+
     resume_content = load_resume_content(resume_path)
 
+    # Load fonts/templates up front instead of inside the first render
+    try:
+        warm_up_renderer()
+    except RenderError as e:
+        raise click.ClickException(str(e))
+
     # Get job text (sync - may need user interaction for Cloudflare)
     job_text = _get_job_text(job_input)
 
@@ -108,10 +155,14 @@ def optimize(
     def on_iteration(i, optimized, validation):
         status = "PASS" if validation.passed else "FAIL"
         scores = ", ".join(
-            f"{r.filter_name}:{r.score:.2f}/{r.threshold:.2f}"
+            f"{r.filter_name}:timeout"
+            if r.timed_out
+            else f"{r.filter_name}:{r.score:.2f}/{r.threshold:.2f}"
+            + ("*" if r.cached else "")
             for r in validation.results
         )
-        click.echo(f"  Iteration {i + 1}: {status} [{scores}]")
+        cached_note = " (* = cached)" if any(r.cached for r in validation.results) else ""
+        click.echo(f"  Iteration {i + 1}: {status} [{scores}]{cached_note}")
 
         # Save intermediate PDF in debug mode
         if debug and debug_dir:
@@ -135,6 +186,8 @@ def optimize(
     settings = get_settings()
     lang_code = lang or settings.default_language
     target_language = get_language(lang_code) if lang_code != "en" else None
+    if speculative is None:
+        speculative = settings.filter_speculative
 
     def on_translation_status(msg: str):
         click.echo(f"  {msg}")
@@ -152,7 +205,7 @@ def optimize(
         if debug:
             debug_dir = pdf_storage.generate_debug_dir(job.company, job.title)
 
-        mode = "sequential" if seq else "parallel"
+        mode = "speculative" if speculative else "sequential" if seq else "parallel"
         shame_mode = " [no-shame]" if no_shame else ""
         lang_label = f" [lang: {lang_code}]" if target_language else ""
         click.echo(f"Optimizing (mode: {mode}{shame_mode}{lang_label})...")
@@ -172,6 +225,8 @@ def optimize(
             user_instructions=instructions,
             language=target_language,
             on_translation_status=on_translation_status,
+            speculative=speculative,
+            filters=filters,
         )
         return first_name, last_name, source, optimized, validation, job
 
@@ -231,6 +286,50 @@ def list_history():
         )
 
 
+@cli.command()
+@click.argument("source", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Parallel extraction processes (default: CPU count)",
+)
+@click.option(
+    "--batch-size", type=int, default=200, help="Resumes written to the cache per batch"
+)
+def ingest(source: Path, workers: int | None, batch_size: int):
+    """Bulk-load resumes into the resume cache.
+
+    SOURCE: Directory (searched recursively) or .zip archive of resumes
+    (.pdf, .txt, .md, .tex)
+    """
+    cache = ResumeCache()
+    batch: list[ResumeSource] = []
+    loaded = written = failed = 0
+
+    try:
+        for result in ingest_resumes(source, workers=workers):
+            if result.error:
+                failed += 1
+                click.echo(f"  FAIL {result.name}: {result.error}", err=True)
+                continue
+            loaded += 1
+            batch.append(ResumeSource(content=result.content))
+            if len(batch) >= batch_size:
+                written += cache.put_many(batch)
+                batch.clear()
+                click.echo(f"  {loaded} loaded...")
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    written += cache.put_many(batch)
+
+    click.echo(
+        f"Ingested {loaded} resumes ({written} new, {loaded - written} already cached), "
+        f"{failed} failed"
+    )
+
+
 def _get_job_text(job_input: str) -> str:
     """Get job text from URL or file path."""
     # Check if file
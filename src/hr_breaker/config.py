@@ -2,7 +2,7 @@ import logging
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from dotenv import load_dotenv
 from pydantic import AliasChoices, Field
@@ -58,6 +58,8 @@ class Settings(BaseSettings):
     pro_model: str = "gemini/gemini-3-pro-preview"
     flash_model: str = "gemini/gemini-3-flash-preview"
     reasoning_effort: str = "medium"
+    # Mark the static prompt prefix with cache-control hints (providers that support it)
+    prompt_cache: bool = False
     cache_dir: Path = Path(".cache/resumes")
     output_dir: Path = Path("output")
     max_iterations: int = 5
@@ -81,20 +83,55 @@ class Settings(BaseSettings):
     filter_llm_threshold: float = 0.7
     filter_vector_threshold: float = 0.4
     filter_ai_generated_threshold: float = 0.4
+    # Start local filters first, LLM filters speculatively, cancel on first failure
+    filter_speculative: bool = False
+    # Per-filter timeouts by cost class and total budget per run (0 = no limit)
+    filter_timeout_local: float = 30.0
+    filter_timeout_remote: float = 120.0
+    filter_latency_budget: float = 0.0
+    # Reuse filter results across iterations when a filter's inputs are unchanged (0 = off)
+    filter_cache_max_entries: int = 256
 
     # Resume length limits
     resume_max_chars: int = 4500
     resume_max_words: int = 520
     resume_page2_overflow_chars: int = 1000
+    resume_extract_max_chars: int = 50000  # Source PDF text budget (0 = no limit)
 
     # Keyword matcher params
     keyword_tfidf_max_features: int = 200
     keyword_tfidf_cutoff: float = 0.1
     keyword_max_missing_display: int = 10
 
-    # Embedding settings
+    # Render cache (0 entries disables the in-memory tier; dir enables disk tier,
+    # pruned oldest-first above the size cap, 0 MB = unbounded)
+    render_cache_max_entries: int = 128
+    render_cache_dir: Path | None = None
+    render_cache_dir_max_mb: int = 256
+
+    # Sandboxed render workers (0 = render in a thread of the calling process,
+    # which cannot be cancelled: no timeout and no memory limit apply)
+    render_workers: int = 2
+    render_timeout: float = 60.0
+    render_max_pending: int = 16
+    render_memory_limit_mb: int = 1024
+    # Resume text for filters: "pdf" re-parses the PDF with PyMuPDF,
+    # "layout" takes it from the WeasyPrint layout tree (no PDF round-trip)
+    render_text_extraction: Literal["pdf", "layout"] = "pdf"
+
+    # Page images sent to vision models (max_dim 0 = no cap; quality for jpeg/webp)
+    vision_image_dpi: int = Field(default=144, ge=1, le=600)
+    vision_image_format: Literal["png", "jpeg", "webp"] = "png"
+    vision_image_quality: int = Field(default=85, ge=1, le=100)
+    vision_image_grayscale: bool = False
+    vision_image_max_dim: int = Field(default=0, ge=0)
+
+    # Embedding settings ("local" = in-process hashing vectorizer, no API calls)
+    embedding_backend: Literal["litellm", "local"] = "litellm"
     embedding_model: str = "gemini/text-embedding-004"
     embedding_output_dimensionality: int = 768
+    # Embeddings by content hash, per model and dimensionality (unset = in-memory only)
+    embedding_cache_path: Path | None = Path(".cache/embeddings.sqlite3")
 
     # Agent limits
     agent_name_extractor_chars: int = 2000
@@ -119,12 +156,19 @@ def get_settings() -> Settings:
     return Settings()
 
 
+@lru_cache(maxsize=8)
+def _litellm_model(model_name: str) -> LiteLLMModel:
+    return LiteLLMModel(model_name=model_name)
+
+
 def get_pro_model() -> LiteLLMModel:
-    return LiteLLMModel(model_name=get_settings().pro_model)
+    """Shared model instance for the configured pro model."""
+    return _litellm_model(get_settings().pro_model)
 
 
 def get_flash_model() -> LiteLLMModel:
-    return LiteLLMModel(model_name=get_settings().flash_model)
+    """Shared model instance for the configured flash model."""
+    return _litellm_model(get_settings().flash_model)
 
 
 def get_model_settings() -> dict[str, Any] | None:
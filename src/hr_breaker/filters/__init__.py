@@ -1,5 +1,6 @@
 from .base import BaseFilter
-from .registry import FilterRegistry
+from .registry import FilterPipeline, FilterRegistry
+from .result_cache import FilterResultCache
 from .content_length import ContentLengthChecker
 from .data_validator import DataValidator
 from .llm_checker import LLMChecker
@@ -10,7 +11,9 @@ from .ai_generated_checker import AIGeneratedChecker
 
 __all__ = [
     "BaseFilter",
+    "FilterPipeline",
     "FilterRegistry",
+    "FilterResultCache",
     "ContentLengthChecker",
     "DataValidator",
     "LLMChecker",
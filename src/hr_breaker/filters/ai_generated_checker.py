@@ -11,6 +11,7 @@ class AIGeneratedChecker(BaseFilter):
 
     name = "AIGeneratedChecker"
     priority = 7
+    cost_class = "remote"
 
     @property
     def threshold(self) -> float:
@@ -1,14 +1,32 @@
+import hashlib
 from abc import ABC, abstractmethod
 
 from hr_breaker.models import FilterResult, JobPosting, OptimizedResume, ResumeSource
 
 
+def content_hash(*parts: object) -> str:
+    """Stable hash of the given parts (str() of each, NUL separated)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 class BaseFilter(ABC):
-    """Abstract base class for resume filters."""
+    """Abstract base class for resume filters.
+
+    The orchestration renders each iteration once and attaches the result to
+    `optimized` (`pdf_text`, `pdf_bytes`, `artifacts`). Filters that need
+    rendered output must use it (see `render_artifacts.ensure_artifacts`) and
+    only render themselves when it is missing.
+    """
 
     name: str = "BaseFilter"
     priority: int = 50  # Lower runs first, 100 = run last (after all others pass)
     threshold: float = 0.5  # Score threshold for passing
+    cost_class: str = "remote"  # "local" (in-process, cheap) or "remote" (LLM/API call)
+    timeout: float | None = None  # Seconds; None = FILTER_TIMEOUT_<COST_CLASS>
 
     def __init__(self, no_shame: bool = False):
         self.no_shame = no_shame
@@ -22,3 +40,28 @@ class BaseFilter(ABC):
     ) -> FilterResult:
         """Evaluate the optimized resume against the job posting."""
         pass
+
+    def cache_key(
+        self,
+        optimized: OptimizedResume,
+        job: JobPosting,
+        source: ResumeSource,
+    ) -> str | None:
+        """Hash of everything `evaluate` depends on, for result memoization.
+
+        The default covers the whole optimized output, the job, the source and
+        the filter's threshold and mode. Filters that read less should override
+        it so unrelated edits still hit; return None to never cache.
+        """
+        content = optimized.html
+        if content is None and optimized.data is not None:
+            content = optimized.data.model_dump_json()
+        return content_hash(
+            self.name,
+            self.threshold,
+            self.no_shame,
+            content,
+            optimized.pdf_text,
+            job.model_dump_json(),
+            source.checksum,
+        )
@@ -1,31 +1,25 @@
 """Content length checker - runs first to fail fast on oversized content."""
 
-import fitz
-
 from hr_breaker.config import get_settings, logger
 from hr_breaker.filters.base import BaseFilter
 from hr_breaker.filters.registry import FilterRegistry
 from hr_breaker.models import FilterResult, JobPosting, OptimizedResume, ResumeSource
 from hr_breaker.services.length_estimator import estimate_content_length
+from hr_breaker.services.render_artifacts import current_artifacts
 from hr_breaker.services.renderer import get_renderer, RenderError
 
 
-def check_page2_overflow(pdf_bytes: bytes) -> str | None:
-    """Check if page 2 is mostly empty (content overflow).
+def page2_overflow_issue(page2_chars: int) -> str | None:
+    """Check if page 2 is mostly empty (content overflow), given its text length.
 
     Returns error message if overflow detected, None otherwise.
     """
     settings = get_settings()
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    if len(doc) < 2:
-        return None
-
-    page2_text = doc[1].get_text().strip()
-    if len(page2_text) > 0 and len(page2_text) < settings.resume_page2_overflow_chars:
+    if 0 < page2_chars < settings.resume_page2_overflow_chars:
         logger.debug(
-            f"check_page2_overflow: page 2 len {len(page2_text)} - overflow from page 1"
+            f"page2_overflow_issue: page 2 len {page2_chars} - overflow from page 1"
         )
-        return f"Page 2 has only {len(page2_text)} chars - content overflow from page 1"
+        return f"Page 2 has only {page2_chars} chars - content overflow from page 1"
     return None
 
 
@@ -35,6 +29,7 @@ class ContentLengthChecker(BaseFilter):
 
     name = "ContentLengthChecker"
     priority = 0  # Runs BEFORE everything
+    cost_class = "local"
     threshold = 1.0
 
     async def evaluate(
@@ -53,11 +48,16 @@ class ContentLengthChecker(BaseFilter):
                 suggestions=[],
             )
 
+        # Prefer the orchestration's render; fall back to a layout-only pass
+        artifacts = current_artifacts(optimized)
         try:
-            renderer = get_renderer()
-            render_result = renderer.render(optimized.html)
-            page_count = render_result.page_count
-            pdf_bytes = render_result.pdf_bytes
+            if artifacts is not None:
+                page_count = artifacts.page_count
+                page_chars = artifacts.page_chars
+            else:
+                measurement = await get_renderer().measure_async(optimized.html)
+                page_count = measurement.page_count
+                page_chars = measurement.page_chars
         except RenderError as e:
             return FilterResult(
                 filter_name=self.name,
@@ -66,6 +66,7 @@ class ContentLengthChecker(BaseFilter):
                 threshold=self.threshold,
                 issues=[f"Rendering failed: {str(e)}"],
                 suggestions=["Fix HTML content to allow rendering"],
+                errored=True,
             )
 
         if page_count > 2:
@@ -79,7 +80,7 @@ class ContentLengthChecker(BaseFilter):
             )
 
         if page_count == 2:
-            overflow_issue = check_page2_overflow(pdf_bytes)
+            overflow_issue = page2_overflow_issue(page_chars[1])
             if overflow_issue:
                 return FilterResult(
                     filter_name=self.name,
@@ -81,6 +81,7 @@ class DataValidator(BaseFilter):
 
     name = "DataValidator"
     priority = 1  # Run first
+    cost_class = "local"
     threshold = 1.0  # Must pass fully
 
     async def evaluate(
@@ -11,6 +11,7 @@ class HallucinationChecker(BaseFilter):
 
     name = "HallucinationChecker"
     priority = 3
+    cost_class = "remote"
 
     @property
     def threshold(self) -> float:
@@ -1,12 +1,25 @@
-import re
 from dataclasses import dataclass
+from functools import lru_cache
 
-from sklearn.feature_extraction.text import TfidfVectorizer
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 
 from hr_breaker.config import get_settings
-from hr_breaker.filters.base import BaseFilter
+from hr_breaker.filters.base import BaseFilter, content_hash
 from hr_breaker.filters.registry import FilterRegistry
 from hr_breaker.models import FilterResult, JobPosting, OptimizedResume, ResumeSource
+from hr_breaker.utils.keyword_automaton import KeywordAutomaton
+
+
+_VECTORIZER_PARAMS = dict(
+    stop_words="english",
+    ngram_range=(1, 2),
+    token_pattern=r"(?u)\b[a-zA-Z][a-zA-Z0-9+#.-]*\b",
+)
+
+# Weight of an explicit job keyword that is not among the job's TF-IDF features
+_DEFAULT_KEYWORD_WEIGHT = 0.1
 
 
 @dataclass
@@ -18,6 +31,89 @@ class KeywordCheckResult:
     missing_keywords: list[str]
 
 
+@dataclass(frozen=True)
+class JobKeywordProfile:
+    """Precompiled keyword model of a job posting.
+
+    Holds the significant terms, their TF-IDF weights and a compiled
+    automaton, so checking a resume against the job is a single scan.
+    """
+
+    keywords: tuple[str, ...]
+    tfidf_scores: dict[str, float]
+    matcher: KeywordAutomaton
+
+    def weight(self, keyword: str) -> float:
+        return self.tfidf_scores.get(keyword, _DEFAULT_KEYWORD_WEIGHT)
+
+    def check(self, resume_text: str, threshold: float) -> KeywordCheckResult:
+        if not self.keywords:
+            return KeywordCheckResult(score=1.0, passed=True, missing_keywords=[])
+
+        found = self.matcher.find(resume_text.lower())
+        matched = [kw for kw in self.keywords if kw in found]
+        missing = [kw for kw in self.keywords if kw not in found]
+
+        matched_weight = sum(self.weight(kw) for kw in matched)
+        total_weight = sum(self.weight(kw) for kw in self.keywords)
+        score = matched_weight / total_weight if total_weight > 0 else 1.0
+
+        missing_sorted = sorted(
+            missing, key=lambda kw: self.tfidf_scores.get(kw, 0), reverse=True
+        )
+
+        return KeywordCheckResult(
+            score=float(score),
+            passed=bool(score >= threshold),
+            missing_keywords=missing_sorted[:get_settings().keyword_max_missing_display],
+        )
+
+
+@lru_cache(maxsize=32)
+def _build_profile(
+    job_text: str, job_keywords: tuple[str, ...], max_features: int, cutoff: float
+) -> JobKeywordProfile:
+    vectorizer = TfidfVectorizer(max_features=max_features, **_VECTORIZER_PARAMS)
+
+    try:
+        tfidf_matrix = vectorizer.fit_transform([job_text])
+    except ValueError:
+        return JobKeywordProfile(
+            keywords=(), tfidf_scores={}, matcher=KeywordAutomaton(())
+        )
+
+    feature_names = vectorizer.get_feature_names_out()
+    tfidf_scores = dict(zip(feature_names, tfidf_matrix.toarray()[0].tolist()))
+
+    significant_keywords = {
+        term for term, score in tfidf_scores.items() if score > cutoff
+    }
+    significant_keywords.update(job_keywords)
+
+    # Sorted so ties in the missing-keyword ranking break the same way every run
+    keywords = tuple(sorted(significant_keywords))
+    return JobKeywordProfile(
+        keywords=keywords,
+        tfidf_scores={kw: tfidf_scores[kw] for kw in keywords if kw in tfidf_scores},
+        matcher=KeywordAutomaton(keywords),
+    )
+
+
+def _job_text(job: JobPosting) -> str:
+    return f"{job.title} {job.description or ''} {' '.join(job.requirements)}".lower()
+
+
+def get_job_keyword_profile(job: JobPosting) -> JobKeywordProfile:
+    """Get the keyword profile for a job, built once per job content."""
+    settings = get_settings()
+    return _build_profile(
+        _job_text(job),
+        tuple(kw.lower() for kw in job.keywords),
+        settings.keyword_tfidf_max_features,
+        settings.keyword_tfidf_cutoff,
+    )
+
+
 def check_keywords(
     resume_text: str, job: JobPosting, threshold: float | None = None
 ) -> KeywordCheckResult:
@@ -31,60 +127,134 @@ def check_keywords(
     Returns:
         KeywordCheckResult with score, passed status, and missing keywords ranked by TF-IDF importance
     """
-    settings = get_settings()
     if threshold is None:
-        threshold = settings.filter_keyword_threshold
+        threshold = get_settings().filter_keyword_threshold
+    return get_job_keyword_profile(job).check(resume_text, threshold)
 
-    resume_lower = resume_text.lower()
-    job_text = f"{job.title} {job.description or ''} {' '.join(job.requirements)}"
 
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        ngram_range=(1, 2),
-        max_features=settings.keyword_tfidf_max_features,
-        token_pattern=r"(?u)\b[a-zA-Z][a-zA-Z0-9+#.-]*\b",
+def _job_tfidf_matrix(counts: sparse.csr_matrix, max_features: int) -> sparse.csr_matrix:
+    """Per-row TF-IDF weights, as if each job had its own single-document fit.
+
+    With one document every IDF is 1, so a job's weights are its L2-normalized
+    counts over its `max_features` most frequent terms. The top-k pick runs the
+    same argsort over the same (alphabetical) term order as the vectorizer's
+    own feature limiting, so ties resolve identically.
+    """
+    indptr, indices, data = [0], [], []
+    for i in range(counts.shape[0]):
+        start, end = counts.indptr[i], counts.indptr[i + 1]
+        row_cols = counts.indices[start:end]
+        row_counts = counts.data[start:end]
+        if len(row_cols) > max_features:
+            keep = np.sort((-row_counts).argsort()[:max_features])
+            row_cols, row_counts = row_cols[keep], row_counts[keep]
+        indices.append(row_cols)
+        data.append(row_counts)
+        indptr.append(indptr[-1] + len(row_cols))
+
+    selected = sparse.csr_matrix(
+        (np.concatenate(data).astype(float), np.concatenate(indices), indptr),
+        shape=counts.shape,
     )
+    norms = np.sqrt(np.asarray(selected.multiply(selected).sum(axis=1)).ravel())
+    inverse = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    return sparse.csr_matrix(sparse.diags(inverse) @ selected)
+
+
+def check_keywords_batch(
+    resume_text: str, jobs: list[JobPosting], threshold: float | None = None
+) -> list[KeywordCheckResult]:
+    """Check keyword coverage of one resume against many job postings.
+
+    Same results as calling check_keywords() per job, but all jobs share one
+    vocabulary, their weights are computed as one sparse matrix and the resume
+    is scanned once.
+
+    Args:
+        resume_text: Plain text from resume
+        jobs: Job postings to score against
+        threshold: Minimum score to pass (default from settings)
+
+    Returns:
+        One KeywordCheckResult per job, in input order
+    """
+    settings = get_settings()
+    if threshold is None:
+        threshold = settings.filter_keyword_threshold
+    if not jobs:
+        return []
 
     try:
-        vectorizer.fit([job_text.lower()])
+        vectorizer = CountVectorizer(**_VECTORIZER_PARAMS)
+        counts = vectorizer.fit_transform([_job_text(job) for job in jobs]).tocsr()
     except ValueError:
-        return KeywordCheckResult(score=1.0, passed=True, missing_keywords=[])
+        return [KeywordCheckResult(score=1.0, passed=True, missing_keywords=[]) for _ in jobs]
+    counts.sort_indices()
 
-    feature_names = vectorizer.get_feature_names_out()
-    tfidf_matrix = vectorizer.transform([job_text.lower()])
-    tfidf_scores = dict(zip(feature_names, tfidf_matrix.toarray()[0]))
+    # Term columns: the shared vocabulary plus explicit keywords outside it
+    terms = list(vectorizer.get_feature_names_out())
+    term_index = {term: j for j, term in enumerate(terms)}
+    kw_rows, kw_cols = [], []
+    for i, job in enumerate(jobs):
+        for kw in dict.fromkeys(kw.lower() for kw in job.keywords):
+            if kw not in term_index:
+                term_index[kw] = len(terms)
+                terms.append(kw)
+            kw_rows.append(i)
+            kw_cols.append(term_index[kw])
+    shape = (len(jobs), len(terms))
 
-    significant_keywords = {
-        term for term, score in tfidf_scores.items()
-        if score > settings.keyword_tfidf_cutoff
-    }
-    for kw in job.keywords:
-        significant_keywords.add(kw.lower())
-
-    if not significant_keywords:
-        return KeywordCheckResult(score=1.0, passed=True, missing_keywords=[])
-
-    matched, missing = [], []
-    for keyword in significant_keywords:
-        pattern = rf"\b{re.escape(keyword)}\b"
-        if re.search(pattern, resume_lower):
-            matched.append(keyword)
-        else:
-            missing.append(keyword)
-
-    matched_weight = sum(tfidf_scores.get(kw, 0.1) for kw in matched)
-    total_weight = sum(tfidf_scores.get(kw, 0.1) for kw in significant_keywords)
-    score = matched_weight / total_weight if total_weight > 0 else 1.0
-
-    missing_sorted = sorted(
-        missing, key=lambda kw: tfidf_scores.get(kw, 0), reverse=True
+    tfidf = _job_tfidf_matrix(counts, settings.keyword_tfidf_max_features)
+    tfidf.resize(shape)
+    keyword_mask = sparse.csr_matrix(
+        (np.ones(len(kw_rows)), (kw_rows, kw_cols)), shape=shape
     )
+    selected_mask = (tfidf != 0).astype(float)
 
-    return KeywordCheckResult(
-        score=float(score),
-        passed=bool(score >= threshold),
-        missing_keywords=missing_sorted[:settings.keyword_max_missing_display],
-    )
+    # Significant terms: TF-IDF above the cutoff, plus the job's explicit keywords
+    significant = ((tfidf > settings.keyword_tfidf_cutoff) + keyword_mask) > 0
+    # Jobs without any vocabulary terms get an empty profile (like a failed fit)
+    has_terms = (np.diff(counts.indptr) > 0).astype(float)
+    significant = sparse.diags(has_terms) @ significant.astype(float)
+    # Explicit keywords that aren't TF-IDF features of the job weigh a flat 0.1
+    default_weights = (keyword_mask - keyword_mask.multiply(selected_mask)) * _DEFAULT_KEYWORD_WEIGHT
+    weights = sparse.csr_matrix(significant.multiply(tfidf + default_weights))
+    significant = sparse.csr_matrix(significant)
+
+    candidates = [terms[j] for j in np.unique(significant.indices)]
+    found = KeywordAutomaton(candidates).find(resume_text.lower())
+    hits = np.array([term in found for term in terms], dtype=float)
+
+    totals = np.asarray(weights.sum(axis=1)).ravel()
+    matched = weights @ hits
+    scores = np.divide(matched, totals, out=np.ones_like(totals), where=totals > 0)
+
+    results = []
+    for i in range(len(jobs)):
+        start, end = significant.indptr[i], significant.indptr[i + 1]
+        if start == end:
+            results.append(KeywordCheckResult(score=1.0, passed=True, missing_keywords=[]))
+            continue
+        row_tfidf = dict(zip(
+            tfidf.indices[tfidf.indptr[i]:tfidf.indptr[i + 1]],
+            tfidf.data[tfidf.indptr[i]:tfidf.indptr[i + 1]],
+        ))
+        missing = [
+            (-row_tfidf.get(j, 0.0), terms[j])
+            for j in significant.indices[start:end]
+            if not hits[j]
+        ]
+        missing.sort()
+        results.append(
+            KeywordCheckResult(
+                score=float(scores[i]),
+                passed=bool(scores[i] >= threshold),
+                missing_keywords=[
+                    term for _, term in missing[:settings.keyword_max_missing_display]
+                ],
+            )
+        )
+    return results
 
 
 @FilterRegistry.register
@@ -93,11 +263,29 @@ class KeywordMatcher(BaseFilter):
 
     name = "KeywordMatcher"
     priority = 4
+    cost_class = "local"
 
     @property
     def threshold(self) -> float:
         return get_settings().filter_keyword_threshold
 
+    def cache_key(
+        self,
+        optimized: OptimizedResume,
+        job: JobPosting,
+        source: ResumeSource,
+    ) -> str | None:
+        # Only the extracted text matters, not markup or styling
+        settings = get_settings()
+        return content_hash(
+            self.name,
+            self.threshold,
+            settings.keyword_tfidf_max_features,
+            settings.keyword_tfidf_cutoff,
+            optimized.pdf_text,
+            job.model_dump_json(),
+        )
+
     async def evaluate(
         self,
         optimized: OptimizedResume,
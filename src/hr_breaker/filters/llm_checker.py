@@ -11,6 +11,7 @@ class LLMChecker(BaseFilter):
 
     name = "LLMChecker"
     priority = 5
+    cost_class = "remote"
 
     @property
     def threshold(self) -> float:
@@ -22,7 +23,9 @@ class LLMChecker(BaseFilter):
         job: JobPosting,
         source: ResumeSource,
     ) -> FilterResult:
-        result, _, page_count, render_warnings = await combined_review(optimized, job)
+        result, pdf_bytes, page_count, render_warnings = await combined_review(
+            optimized, job
+        )
 
         logger.debug(
             f"LLMChecker: professional={result.looks_professional}, "
@@ -67,4 +70,6 @@ class LLMChecker(BaseFilter):
             issues=issues,
             suggestions=suggestions,
             feedback=feedback,
+            # Render or PDF-to-image failure: the review never saw the resume
+            errored=pdf_bytes is None or page_count == 0,
         )
@@ -1,12 +1,37 @@
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from typing import Type
 
 from hr_breaker.filters.base import BaseFilter
 
 
+@dataclass(frozen=True)
+class FilterPipeline:
+    """Instantiated filters for one configuration, sorted by priority.
+
+    Filters are stateless apart from `no_shame`, so one pipeline can serve
+    every iteration of every run (including concurrent ones).
+    """
+
+    filters: tuple[BaseFilter, ...]
+    no_shame: bool = False
+
+    @property
+    def names(self) -> list[str]:
+        return [f.name for f in self.filters]
+
+    def __iter__(self) -> Iterator[BaseFilter]:
+        return iter(self.filters)
+
+    def __len__(self) -> int:
+        return len(self.filters)
+
+
 class FilterRegistry:
     """Registry for filter plugins."""
 
     _filters: dict[str, Type[BaseFilter]] = {}
+    _pipelines: dict[tuple, FilterPipeline] = {}
 
     @classmethod
     def register(cls, filter_class: Type[BaseFilter]) -> Type[BaseFilter]:
@@ -25,3 +50,50 @@ class FilterRegistry:
     @classmethod
     def names(cls) -> list[str]:
         return list(cls._filters.keys())
+
+    @classmethod
+    def pipeline(
+        cls,
+        no_shame: bool = False,
+        enabled: Iterable[str] | None = None,
+        disabled: Iterable[str] = (),
+    ) -> FilterPipeline:
+        """Shared pipeline of filter instances for this configuration.
+
+        Args:
+            no_shame: Lenient mode
+            enabled: Only these filters (default: all registered)
+            disabled: Filters to leave out
+
+        Raises:
+            ValueError: If a name does not match a registered filter.
+        """
+        filter_classes = tuple(cls.all())
+        enabled = None if enabled is None else frozenset(enabled)
+        disabled = frozenset(disabled)
+        key = (filter_classes, no_shame, enabled, disabled)
+        pipeline = cls._pipelines.get(key)
+        if pipeline is not None:
+            return pipeline
+
+        known = {f.name for f in filter_classes}
+        unknown = ((enabled or frozenset()) | disabled) - known
+        if unknown:
+            raise ValueError(
+                f"Unknown filter(s): {', '.join(sorted(unknown))}. "
+                f"Available: {', '.join(sorted(known))}"
+            )
+
+        selected = [
+            f
+            for f in filter_classes
+            if (enabled is None or f.name in enabled) and f.name not in disabled
+        ]
+        pipeline = FilterPipeline(
+            filters=tuple(
+                f(no_shame=no_shame) for f in sorted(selected, key=lambda f: f.priority)
+            ),
+            no_shame=no_shame,
+        )
+        cls._pipelines[key] = pipeline
+        return pipeline
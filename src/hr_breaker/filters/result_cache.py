@@ -0,0 +1,61 @@
+"""Memoization of filter results across optimization iterations."""
+
+import threading
+from collections import OrderedDict
+
+from hr_breaker.models import FilterResult
+
+
+class FilterResultCache:
+    """Bounded LRU cache of FilterResults keyed by `BaseFilter.cache_key`.
+
+    The optimizer is asked for minimal changes, so consecutive iterations
+    often hand identical inputs to a filter. A hit is returned as a copy with
+    `cached=True`. Timed out and errored results are never stored, so a
+    transient failure is retried on the next iteration.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, FilterResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> FilterResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return result.model_copy(deep=True, update={"cached": True})
+
+    def put(self, key: str, result: FilterResult) -> None:
+        if self.max_entries <= 0 or result.timed_out or result.errored:
+            return
+        with self._lock:
+            self._entries[key] = result.model_copy(deep=True)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
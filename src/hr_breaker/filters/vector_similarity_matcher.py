@@ -1,31 +1,47 @@
-from litellm import aembedding as litellm_aembedding
-
 from hr_breaker.config import get_settings
-from hr_breaker.filters.base import BaseFilter
+from hr_breaker.filters.base import BaseFilter, content_hash
 from hr_breaker.filters.registry import FilterRegistry
 from hr_breaker.models import FilterResult, JobPosting, OptimizedResume, ResumeSource
-from hr_breaker.utils.retry import run_with_retry
+from hr_breaker.services.embeddings import get_embedding_backend
+from hr_breaker.utils.similarity import cosine_similarity
 
 
 @FilterRegistry.register
 class VectorSimilarityMatcher(BaseFilter):
-    """Vector similarity filter using embeddings via litellm."""
+    """Vector similarity filter using embeddings from the configured backend."""
 
     name = "VectorSimilarityMatcher"
     priority = 6
+    cost_class = "remote"
 
     @property
     def threshold(self) -> float:
         return get_settings().filter_vector_threshold
 
-    async def evaluate(
+    def cache_key(
         self,
         optimized: OptimizedResume,
         job: JobPosting,
         source: ResumeSource,
-    ) -> FilterResult:
+    ) -> str | None:
+        # Only the extracted text matters, not markup or styling
         settings = get_settings()
+        return content_hash(
+            self.name,
+            self.threshold,
+            settings.embedding_backend,
+            settings.embedding_model,
+            settings.embedding_output_dimensionality,
+            optimized.pdf_text,
+            job.model_dump_json(),
+        )
 
+    async def evaluate(
+        self,
+        optimized: OptimizedResume,
+        job: JobPosting,
+        source: ResumeSource,
+    ) -> FilterResult:
         if optimized.pdf_text is None:
             return FilterResult(
                 filter_name=self.name,
@@ -39,14 +55,9 @@ class VectorSimilarityMatcher(BaseFilter):
         resume_text = optimized.pdf_text
         job_text = f"{job.title} {job.description} {' '.join(job.requirements)}"
 
+        backend = get_embedding_backend()
         try:
-            result = await run_with_retry(
-                litellm_aembedding,
-                model=settings.embedding_model,
-                input=[resume_text, job_text],
-                dimensions=settings.embedding_output_dimensionality,
-            )
-            embeddings = [item["embedding"] for item in result.data]
+            embeddings = await backend.embed([resume_text, job_text])
         except Exception as e:
             return FilterResult(
                 filter_name=self.name,
@@ -55,17 +66,14 @@ class VectorSimilarityMatcher(BaseFilter):
                 threshold=self.threshold,
                 issues=[f"Embedding API error: {e}"],
                 suggestions=[],
+                errored=True,
             )
 
-        # Cosine similarity
-        e1, e2 = embeddings[0], embeddings[1]
-        dot = sum(a * b for a, b in zip(e1, e2))
-        norm1 = sum(a * a for a in e1) ** 0.5
-        norm2 = sum(b * b for b in e2) ** 0.5
-        similarity = dot / (norm1 * norm2) if norm1 and norm2 else 0.0
+        similarity = cosine_similarity(embeddings[0], embeddings[1])
 
-        # Normalize to 0-1 (cosine similarity is -1 to 1)
-        score = (similarity + 1) / 2
+        # Normalize to 0-1 (cosine similarity is -1 to 1 unless the backend
+        # only produces non-negative vectors)
+        score = similarity if backend.non_negative else (similarity + 1) / 2
 
         issues = []
         if score < self.threshold:
@@ -3,13 +3,19 @@
 pydantic-ai-litellm v0.2.3 stringifies BinaryContent instead of encoding
 images as base64 data URIs. This patch fixes _map_messages to produce
 OpenAI-compatible image_url parts that litellm forwards to any provider.
+It also turns CachePoint markers into `cache_control` hints.
 """
 
 import base64
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Any
 
 from pydantic_ai.messages import (
     BinaryContent,
+    CachePoint,
     ImageUrl,
     ModelMessage,
     ModelRequest,
@@ -26,6 +32,85 @@ from pydantic_ai_litellm import LiteLLMModel
 
 _ORIGINAL = LiteLLMModel._map_messages
 
+# Bounds for the encoded data-URI cache (config imports this module, so these
+# are constants rather than settings)
+_DATA_URI_CACHE_MAX_ENTRIES = 32
+_DATA_URI_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _DataUriCache:
+    """Bounded LRU of base64 data URIs for image BinaryContent.
+
+    pydantic-ai replays the whole message history on every model request, so
+    without this each earlier image is re-encoded on every later turn. Lookups
+    go by object identity first (validated with a weakref, so a reused id()
+    never hits), then by content hash for equal images in distinct objects.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.encodes = 0
+        self._uris: OrderedDict[str, str] = OrderedDict()
+        self._by_id: dict[int, tuple[weakref.ref, str]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, item: BinaryContent) -> str:
+        with self._lock:
+            entry = self._by_id.get(id(item))
+            if entry is not None and entry[0]() is item:
+                uri = self._lookup(entry[1])
+                if uri is not None:
+                    return uri
+
+        digest = hashlib.blake2b(item.data, digest_size=16).hexdigest()
+        key = f"{item.media_type}:{digest}"
+        with self._lock:
+            uri = self._lookup(key)
+        if uri is None:
+            b64 = base64.b64encode(item.data).decode("utf-8")
+            uri = f"data:{item.media_type};base64,{b64}"
+            with self._lock:
+                self.encodes += 1
+                self._store(key, uri)
+
+        with self._lock:
+            item_id = id(item)
+            ref = weakref.ref(item, lambda _: self._by_id.pop(item_id, None))
+            self._by_id[item_id] = (ref, key)
+        return uri
+
+    def _lookup(self, key: str) -> str | None:
+        uri = self._uris.get(key)
+        if uri is not None:
+            self._uris.move_to_end(key)
+        return uri
+
+    def _store(self, key: str, uri: str) -> None:
+        if key in self._uris:
+            return
+        self._uris[key] = uri
+        self._size += len(uri)
+        while len(self._uris) > 1 and (
+            len(self._uris) > self.max_entries or self._size > self.max_bytes
+        ):
+            _, evicted = self._uris.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._uris.clear()
+            self._by_id.clear()
+            self._size = 0
+            self.encodes = 0
+
+    def __len__(self) -> int:
+        return len(self._uris)
+
+
+_data_uri_cache = _DataUriCache(_DATA_URI_CACHE_MAX_ENTRIES, _DATA_URI_CACHE_MAX_BYTES)
+
 
 def _convert_user_content(content) -> str | list[dict[str, Any]]:
     """Convert UserPromptPart.content to litellm format, handling vision."""
@@ -37,11 +122,17 @@ def _convert_user_content(content) -> str | list[dict[str, Any]]:
         if isinstance(item, str):
             parts.append({"type": "text", "text": item})
         elif isinstance(item, BinaryContent) and item.is_image:
-            b64 = base64.b64encode(item.data).decode("utf-8")
-            data_uri = f"data:{item.media_type};base64,{b64}"
+            data_uri = _data_uri_cache.get(item)
             parts.append({"type": "image_url", "image_url": {"url": data_uri}})
         elif isinstance(item, ImageUrl):
             parts.append({"type": "image_url", "image_url": {"url": item.url}})
+        elif isinstance(item, CachePoint):
+            # litellm forwards cache_control on the part ending the cached prefix
+            if parts:
+                cache_control = {"type": "ephemeral"}
+                if item.ttl != "5m":
+                    cache_control["ttl"] = item.ttl
+                parts[-1]["cache_control"] = cache_control
         elif isinstance(item, BinaryContent):
             # Non-image binary: fall back to text description
             parts.append({"type": "text", "text": f"[{item.media_type} binary content]"})
@@ -17,8 +17,10 @@ from hr_breaker.models import GeneratedPDF, ResumeSource, ValidationResult, SUPP
 from hr_breaker.orchestration import optimize_for_job, translate_and_rerender
 from hr_breaker.services import (
     PDFStorage,
+    RenderError,
     ResumeCache,
     scrape_job_posting,
+    warm_up_renderer,
     CloudflareBlockedError,
 )
 from hr_breaker.services.pdf_parser import load_resume_content_from_upload
@@ -30,6 +32,12 @@ settings = get_settings()
 
 st.set_page_config(page_title="HR-Breaker", page_icon="*", layout="wide")
 
+# Load fonts/templates once per process (no-op after the first run)
+try:
+    warm_up_renderer()
+except RenderError as e:
+    st.error(str(e))
+
 
 def run_async(coro):
     """Run async coroutine in sync context."""
@@ -59,8 +67,9 @@ def display_filter_results(validation: ValidationResult):
     """Display filter results in UI."""
     for result in validation.results:
         icon = "[OK]" if result.passed else "[X]"
+        cached = " (cached)" if result.cached else ""
         with st.expander(
-            f"{icon} {result.filter_name} - Score: {result.score:.2f}/{result.threshold:.2f}"
+            f"{icon} {result.filter_name} - Score: {result.score:.2f}/{result.threshold:.2f}{cached}"
         ):
             if result.issues:
                 st.write("**Issues:**")
@@ -210,8 +219,9 @@ with col_resume:
                 key=uploader_key,
             )
             if uploaded_file:
+                # getbuffer() hands PyMuPDF the upload without copying it
                 resume_content = load_resume_content_from_upload(
-                    uploaded_file.name, uploaded_file.read()
+                    uploaded_file.name, uploaded_file.getbuffer()
                 )
         else:
             pasted_resume = st.text_area(
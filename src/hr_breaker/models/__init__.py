@@ -2,6 +2,7 @@ from .resume import ResumeSource, OptimizedResume
 from .resume_data import (
     ResumeData,
     RenderResult,
+    RenderMeasurement,
     ContactInfo,
     Experience,
     Education,
@@ -17,6 +18,7 @@ __all__ = [
     "OptimizedResume",
     "ResumeData",
     "RenderResult",
+    "RenderMeasurement",
     "ContactInfo",
     "Experience",
     "Education",
@@ -13,6 +13,11 @@ class FilterResult(BaseModel):
     issues: list[str] = Field(default_factory=list)
     suggestions: list[str] = Field(default_factory=list)
     feedback: str = Field(default="", description="Free-form feedback for optimizer")
+    timed_out: bool = Field(default=False, description="Filter did not finish in time")
+    cached: bool = Field(default=False, description="Reused from an earlier iteration")
+    errored: bool = Field(
+        default=False, description="Error fallback, not a verdict on the resume"
+    )
 
 
 class ValidationResult(BaseModel):
@@ -28,7 +33,8 @@ class ValidationResult(BaseModel):
     def feedback_text(self) -> str:
         lines = []
         for r in self.results:
-            if not r.passed:
+            # A timeout says nothing about the resume - nothing for the optimizer to fix
+            if not r.passed and not r.timed_out:
                 lines.append(f"[{r.filter_name}] Score: {r.score:.2f} (threshold: {r.threshold:.2f})")
                 for issue in r.issues:
                     lines.append(f"  - Issue: {issue}")
@@ -50,3 +50,5 @@ class OptimizedResume(BaseModel):
     pdf_text: str | None = None
     pdf_bytes: bytes | None = None
     pdf_path: Path | None = None
+    # RenderArtifacts from the last render (not serialized)
+    artifacts: Any = Field(default=None, exclude=True, repr=False)
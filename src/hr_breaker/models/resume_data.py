@@ -65,6 +65,16 @@ class RenderResult(BaseModel):
     pdf_bytes: bytes
     page_count: int
     warnings: list[str] = Field(default_factory=list)
+    page_chars: list[int] = Field(default_factory=list)  # Text length per page
+    page_texts: list[str] = Field(default_factory=list)  # Text per page, from layout
 
     class Config:
         arbitrary_types_allowed = True
+
+
+class RenderMeasurement(BaseModel):
+    """Layout-only render result: page stats without PDF serialization."""
+
+    page_count: int
+    page_chars: list[int] = Field(default_factory=list)  # Text length per page
+    warnings: list[str] = Field(default_factory=list)
@@ -10,7 +10,10 @@ from hr_breaker.config import get_settings, logger
 from hr_breaker.filters import (
     LLMChecker,
     DataValidator,
+    BaseFilter,
+    FilterPipeline,
     FilterRegistry,
+    FilterResultCache,
     HallucinationChecker,
     KeywordMatcher,
     VectorSimilarityMatcher,
@@ -24,8 +27,8 @@ from hr_breaker.models import (
     ResumeSource,
     ValidationResult,
 )
-from hr_breaker.services.pdf_parser import extract_text_from_pdf_bytes
-from hr_breaker.services.renderer import RenderError, HTMLRenderer
+from hr_breaker.services.render_artifacts import RenderArtifacts
+from hr_breaker.services.renderer import RenderError, HTMLRenderer, get_renderer
 
 # Ensure filters are registered
 _ = (
@@ -45,64 +48,231 @@ def log_time(operation: str):
     logger.debug(f"{operation}: {elapsed:.2f}s")
 
 
+def _filter_error_result(f, exc: BaseException) -> FilterResult:
+    """Failed FilterResult standing in for a filter that raised."""
+    logger.error(f"Filter {f.name} raised exception: {exc}")
+    return FilterResult(
+        filter_name=f.name,
+        passed=False,
+        score=0.0,
+        threshold=getattr(f, "threshold", 0.5),
+        issues=[f"Filter error: {type(exc).__name__}: {exc}"],
+        suggestions=["Check filter implementation"],
+        errored=True,
+    )
+
+
+def _filter_timeout(f) -> float | None:
+    """Filter's own timeout, else the default for its cost class (None = no limit)."""
+    timeout = getattr(f, "timeout", None)
+    if timeout is None:
+        settings = get_settings()
+        if getattr(f, "cost_class", "remote") == "local":
+            timeout = settings.filter_timeout_local
+        else:
+            timeout = settings.filter_timeout_remote
+    return timeout or None
+
+
+class _FilterRaisedTimeout(Exception):
+    """A TimeoutError raised by the filter itself, not by its time limit."""
+
+
+async def _own_timeouts(coro):
+    """Keep a filter's own TimeoutError apart from the one `wait_for` raises."""
+    try:
+        return await coro
+    except (TimeoutError, asyncio.TimeoutError) as e:
+        raise _FilterRaisedTimeout() from e
+
+
+async def _evaluate(
+    f,
+    optimized: OptimizedResume,
+    job: JobPosting,
+    source: ResumeSource,
+    deadline: float | None,
+    cache: FilterResultCache | None = None,
+) -> FilterResult:
+    """Evaluate one filter within its timeout and what is left of the run's budget.
+
+    With a cache, a filter whose `cache_key` was seen before is not run at all.
+    """
+    key = None
+    if cache is not None and hasattr(f, "cache_key"):
+        key = f.cache_key(optimized, job, source)
+        cached = cache.get(key) if key is not None else None
+        if cached is not None:
+            logger.debug(f"{f.name}: cached result")
+            return cached
+
+    timeout = _filter_timeout(f)
+    if deadline is not None:
+        remaining = max(0.0, deadline - time.perf_counter())
+        timeout = remaining if timeout is None else min(timeout, remaining)
+
+    try:
+        result = await asyncio.wait_for(
+            _own_timeouts(f.evaluate(optimized, job, source)), timeout
+        )
+    except _FilterRaisedTimeout as e:
+        raise e.__cause__
+    except asyncio.TimeoutError:
+        logger.warning(f"Filter {f.name} timed out after {timeout:.1f}s")
+        return FilterResult(
+            filter_name=f.name,
+            passed=False,
+            score=0.0,
+            threshold=getattr(f, "threshold", 0.5),
+            issues=[f"Filter timed out after {timeout:.1f}s"],
+            timed_out=True,
+        )
+
+    if key is not None:
+        cache.put(key, result)
+    return result
+
+
+async def _run_speculative(
+    filters: FilterPipeline,
+    optimized: OptimizedResume,
+    job: JobPosting,
+    source: ResumeSource,
+    deadline: float | None = None,
+    cache: FilterResultCache | None = None,
+) -> list[FilterResult]:
+    """Local filters first, remote ones speculatively, cancel on the first failure.
+
+    Local filters get one event loop turn before any remote filter starts, so a
+    synchronous failure (e.g. DataValidator) costs no LLM calls at all. Remote
+    filters then run concurrently with the remaining local work, and whatever
+    is still in flight is cancelled as soon as a filter with priority < 100
+    fails. Filters with priority >= 100 run only after all others passed.
+    """
+    stages = [
+        [f for f in filters if f.priority < 100],
+        [f for f in filters if f.priority >= 100],
+    ]
+    collected: list[tuple[int, FilterResult]] = []
+    failed = False
+
+    for stage in stages:
+        local = [f for f in stage if getattr(f, "cost_class", "remote") == "local"]
+        remote = [f for f in stage if f not in local]
+        in_flight: dict[asyncio.Future, BaseFilter] = {}
+
+        def launch(stage_filters):
+            for f in stage_filters:
+                task = asyncio.ensure_future(_evaluate(f, optimized, job, source, deadline, cache))
+                in_flight[task] = f
+
+        def collect() -> bool:
+            blocked = False
+            for task in [t for t in in_flight if t.done()]:
+                f = in_flight.pop(task)
+                exc = task.exception()
+                result = _filter_error_result(f, exc) if exc else task.result()
+                collected.append((f.priority, result))
+                blocked |= not result.passed and f.priority < 100
+            return blocked
+
+        try:
+            launch(local)
+            await asyncio.sleep(0)
+            failed = collect()
+            if not failed:
+                launch(remote)
+            while in_flight and not failed:
+                await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                failed = collect()
+        finally:
+            if in_flight:
+                names = ", ".join(f.name for f in in_flight.values())
+                logger.debug(f"Cancelling filters: {names}")
+                for task in in_flight:
+                    task.cancel()
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        if failed:
+            break
+
+    return [result for _, result in sorted(collected, key=lambda pr: pr[0])]
+
+
 async def run_filters(
     optimized: OptimizedResume,
     job: JobPosting,
     source: ResumeSource,
     parallel: bool = False,
     no_shame: bool = False,
+    speculative: bool = False,
+    latency_budget: float | None = None,
+    cache: FilterResultCache | None = None,
+    pipeline: FilterPipeline | None = None,
 ) -> ValidationResult:
-    """Run filters, either sequentially (early exit) or in parallel."""
-    filters = FilterRegistry.all()
+    """Run filters sequentially (early exit), in parallel, or speculatively.
+
+    Speculative mode (takes precedence over `parallel`) has parallel-mode
+    latency with sequential-mode cost: see `_run_speculative`.
+
+    Every filter runs under its timeout (`BaseFilter.timeout`, else the
+    default for its cost class) and within `latency_budget` seconds for the
+    whole run (default from settings, 0 = unlimited). A filter that runs out
+    of time yields a failed FilterResult with `timed_out=True`.
+
+    With `cache`, filters whose inputs were already evaluated are not re-run;
+    their results come back with `cached=True`.
+
+    `pipeline` defaults to all registered filters for `no_shame`.
+    """
+    filters = (
+        pipeline if pipeline is not None else FilterRegistry.pipeline(no_shame=no_shame)
+    )
+    if latency_budget is None:
+        latency_budget = get_settings().filter_latency_budget
+    deadline = time.perf_counter() + latency_budget if latency_budget else None
+
+    if speculative:
+        start = time.perf_counter()
+        results = await _run_speculative(
+            filters, optimized, job, source, deadline, cache
+        )
+        logger.debug(f"All filters (speculative): {time.perf_counter() - start:.2f}s")
+        return ValidationResult(results=results)
 
     if parallel:
         # Run all filters concurrently
         start = time.perf_counter()
-        filter_instances = [filter_cls(no_shame=no_shame) for filter_cls in filters]
-        tasks = [f.evaluate(optimized, job, source) for f in filter_instances]
+        tasks = [_evaluate(f, optimized, job, source, deadline, cache) for f in filters]
         raw_results = await asyncio.gather(*tasks, return_exceptions=True)
         logger.debug(f"All filters (parallel): {time.perf_counter() - start:.2f}s")
 
         # Convert exceptions to failed FilterResults
-        results = []
-        for f, result in zip(filter_instances, raw_results):
-            if isinstance(result, Exception):
-                logger.error(f"Filter {f.name} raised exception: {result}")
-                results.append(
-                    FilterResult(
-                        filter_name=f.name,
-                        passed=False,
-                        score=0.0,
-                        threshold=getattr(f, "threshold", 0.5),
-                        issues=[f"Filter error: {type(result).__name__}: {result}"],
-                        suggestions=["Check filter implementation"],
-                    )
-                )
-            else:
-                results.append(result)
+        results = [
+            _filter_error_result(f, result) if isinstance(result, Exception) else result
+            for f, result in zip(filters, raw_results)
+        ]
         return ValidationResult(results=results)
 
     # Sequential mode: sorted by priority, early exit on failure
     results = []
-    filters = sorted(filters, key=lambda f: f.priority)
 
-    for filter_cls in filters:
+    for f in filters:
         # Skip high-priority (last) filters if earlier ones failed
         if (
-            filter_cls.priority >= 100
+            f.priority >= 100
             and results
             and not all(r.passed for r in results)
         ):
             continue
 
-        f = filter_cls(no_shame=no_shame)
         start = time.perf_counter()
-        result = await f.evaluate(optimized, job, source)
-        logger.debug(f"{filter_cls.name}: {time.perf_counter() - start:.2f}s")
+        result = await _evaluate(f, optimized, job, source, deadline, cache)
+        logger.debug(f"{f.name}: {time.perf_counter() - start:.2f}s")
         results.append(result)
 
         # Early exit on failure (unless it's a final check)
-        if not result.passed and filter_cls.priority < 100:
+        if not result.passed and f.priority < 100:
             break
 
     return ValidationResult(results=results)
@@ -119,6 +289,8 @@ async def optimize_for_job(
     user_instructions: str | None = None,
     language: Language | None = None,
     on_translation_status: Callable[[str], None] | None = None,
+    speculative: bool | None = None,
+    filters: FilterPipeline | None = None,
 ) -> tuple[OptimizedResume, ValidationResult, JobPosting]:
     """
     Core optimization loop.
@@ -134,6 +306,8 @@ async def optimize_for_job(
         user_instructions: Optional user instructions for the optimizer
         language: Target language for resume output (None = English, no translation)
         on_translation_status: Optional callback(status_message) for translation progress
+        speculative: Speculative filter scheduling (default from settings)
+        filters: Filter pipeline (default: all registered filters for no_shame)
 
     Returns:
         (optimized_resume, validation_result, job_posting)
@@ -144,8 +318,12 @@ async def optimize_for_job(
 
     if max_iterations is None:
         max_iterations = settings.max_iterations
+    if speculative is None:
+        speculative = settings.filter_speculative
+    if filters is None:
+        filters = FilterRegistry.pipeline(no_shame=no_shame)
 
-    renderer = HTMLRenderer()
+    renderer = get_renderer()
 
     if job is None:
         if job_text is None:
@@ -155,6 +333,8 @@ async def optimize_for_job(
     optimized = None
     validation = None
     last_attempt: str | None = None
+    # Consecutive iterations often leave a filter's inputs unchanged
+    filter_cache = FilterResultCache(settings.filter_cache_max_entries)
 
     if no_shame:
         logger.info("No-shame mode enabled")
@@ -178,7 +358,7 @@ async def optimize_for_job(
         )
 
         # Render PDF and extract text for filters (like real ATS)
-        optimized = _render_and_extract(optimized, renderer)
+        optimized = await _render_and_extract(optimized, renderer)
 
         if optimized.pdf_text is None:
             # PDF rendering failed - treat as validation failure
@@ -196,8 +376,21 @@ async def optimize_for_job(
             )
         else:
             validation = await run_filters(
-                optimized, job, source, parallel=parallel, no_shame=no_shame
+                optimized,
+                job,
+                source,
+                parallel=parallel,
+                no_shame=no_shame,
+                speculative=speculative,
+                cache=filter_cache,
+                pipeline=filters,
             )
+            cached = [r.filter_name for r in validation.results if r.cached]
+            if cached:
+                logger.info(f"Reused cached filter results: {', '.join(cached)}")
+            # Filters are done with the parsed PDF; derived text/image stay cached
+            if optimized.artifacts is not None:
+                optimized.artifacts.close()
 
         if on_iteration:
             on_iteration(i, optimized, validation)
@@ -229,7 +422,7 @@ async def translate_and_rerender(
     Runs a mini translate-review loop (max_translation_iterations) to ensure quality.
     """
     if renderer is None:
-        renderer = HTMLRenderer()
+        renderer = get_renderer()
     if max_translation_iterations is None:
         max_translation_iterations = get_settings().translation_max_iterations
     original_html = optimized.html
@@ -278,7 +471,9 @@ async def translate_and_rerender(
 
     # Update optimized with translated HTML and re-render PDF
     translated_optimized = optimized.model_copy(update={"html": translation.html})
-    translated_optimized = _render_and_extract(translated_optimized, renderer)
+    translated_optimized = await _render_and_extract(translated_optimized, renderer)
+    if translated_optimized.artifacts is not None:
+        translated_optimized.artifacts.close()
 
     if on_status:
         on_status("Translation complete")
@@ -286,24 +481,30 @@ async def translate_and_rerender(
     return translated_optimized
 
 
-def _render_and_extract(optimized: OptimizedResume, renderer) -> OptimizedResume:
+async def _render_and_extract(optimized: OptimizedResume, renderer) -> OptimizedResume:
     """Render PDF and extract text, updating the OptimizedResume."""
     try:
         with log_time("render_pdf"):
             # Use html if available, otherwise fall back to data (legacy)
             if optimized.html is not None:
-                result = renderer.render(optimized.html)
+                result = await renderer.render_async(optimized.html)
             elif optimized.data is not None:
-                result = renderer.render_data(optimized.data)
+                result = await renderer.render_data_async(optimized.data)
             else:
                 raise RenderError("No content to render (neither html nor data)")
 
-        # Extract text from rendered PDF
+        # Extract text from rendered PDF; artifacts keep the parsed document
+        # so filters reuse it instead of re-opening the PDF
+        artifacts = RenderArtifacts.from_result(result, html=optimized.html)
         with log_time("extract_text_from_pdf"):
-            pdf_text = extract_text_from_pdf_bytes(result.pdf_bytes)
+            pdf_text = artifacts.text
 
         return optimized.model_copy(
-            update={"pdf_text": pdf_text, "pdf_bytes": result.pdf_bytes}
+            update={
+                "pdf_text": pdf_text,
+                "pdf_bytes": result.pdf_bytes,
+                "artifacts": artifacts,
+            }
         )
     except RenderError as e:
         logger.error(f"Render error: {e}")
@@ -1,7 +1,7 @@
 from .job_scraper import scrape_job_posting, ScrapingError, CloudflareBlockedError
 from .cache import ResumeCache
 from .pdf_storage import PDFStorage
-from .renderer import get_renderer, BaseRenderer, HTMLRenderer, RenderError
+from .renderer import get_renderer, warm_up_renderer, BaseRenderer, HTMLRenderer, RenderError
 
 __all__ = [
     "scrape_job_posting",
@@ -10,6 +10,7 @@ __all__ = [
     "ResumeCache",
     "PDFStorage",
     "get_renderer",
+    "warm_up_renderer",
     "BaseRenderer",
     "HTMLRenderer",
     "RenderError",
@@ -1,4 +1,5 @@
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
 from hr_breaker.config import get_settings
@@ -29,6 +30,18 @@ class ResumeCache:
         path = self._path(resume.checksum)
         path.write_text(resume.model_dump_json(), encoding="utf-8")
 
+    def put_many(self, resumes: Iterable[ResumeSource]) -> int:
+        """Store resumes not already cached. Returns how many were written."""
+        existing = {path.stem for path in self.cache_dir.glob("*.json")}
+        written = 0
+        for resume in resumes:
+            if resume.checksum in existing:
+                continue
+            self.put(resume)
+            existing.add(resume.checksum)
+            written += 1
+        return written
+
     def exists(self, checksum: str) -> bool:
         return self._path(checksum).exists()
 
@@ -0,0 +1,123 @@
+"""Persistent embedding store keyed by content hash.
+
+Only texts never embedded before with the same model and dimensionality
+reach the embedding API. Job embeddings in particular are reused across
+iterations, runs and every candidate applying to the same posting.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from hr_breaker.config import get_settings, logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, dimensions, digest)
+)
+"""
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite table of float32 embeddings, scoped per model and dimensionality.
+
+    `path=None` keeps the table in memory (per process).
+    """
+
+    def __init__(self, path: Path | None, model: str, dimensions: int):
+        self.path = path
+        self.model = model
+        self.dimensions = dimensions
+        self.hits = 0
+        self.misses = 0
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            ":memory:" if path is None else str(path), check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            if path is not None:
+                # Several processes (CLI, Streamlit, ingest workers) may share the file
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    def get_many(self, texts: Sequence[str]) -> list[np.ndarray | None]:
+        """Cached embedding for each text, None where it is missing."""
+        if not texts:
+            return []
+        digests = [text_digest(text) for text in texts]
+        placeholders = ",".join("?" * len(digests))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT digest, vector FROM embeddings"
+                f" WHERE model = ? AND dimensions = ? AND digest IN ({placeholders})",
+                (self.model, self.dimensions, *digests),
+            ).fetchall()
+        found = {digest: np.frombuffer(blob, dtype=np.float32) for digest, blob in rows}
+        embeddings = [found.get(digest) for digest in digests]
+        hits = sum(e is not None for e in embeddings)
+        self.hits += hits
+        self.misses += len(embeddings) - hits
+        return embeddings
+
+    def put_many(self, texts: Sequence[str], embeddings) -> None:
+        rows = [
+            (
+                self.model,
+                self.dimensions,
+                text_digest(text),
+                np.asarray(embedding, dtype=np.float32).tobytes(),
+            )
+            for text, embedding in zip(texts, embeddings)
+        ]
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", rows
+                )
+        except sqlite3.Error as e:
+            # A read-only or locked cache must not fail the filter
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE model = ? AND dimensions = ?",
+                (self.model, self.dimensions),
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@lru_cache(maxsize=8)
+def _open_cache(path: Path | None, model: str, dimensions: int) -> EmbeddingCache:
+    return EmbeddingCache(path, model, dimensions)
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Process-wide cache for the configured embedding model and dimensionality."""
+    settings = get_settings()
+    return _open_cache(
+        settings.embedding_cache_path,
+        settings.embedding_model,
+        settings.embedding_output_dimensionality,
+    )
@@ -0,0 +1,104 @@
+"""Embedding backends for vector similarity.
+
+`litellm` calls the remote EMBEDDING_MODEL (with the persistent embedding
+cache in front of it). `local` projects text in-process with a hashing
+vectorizer: no network, no fitting, sub-millisecond per text, but only
+lexical similarity. Its vectors are non-negative, so cosine similarity
+already lies in [0, 1] and is used as the score without remapping.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+from litellm import aembedding as litellm_aembedding
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from hr_breaker.config import get_settings
+from hr_breaker.services.embedding_cache import get_embedding_cache
+from hr_breaker.utils.retry import run_with_retry
+from hr_breaker.utils.similarity import as_matrix
+
+
+class EmbeddingBackend(ABC):
+    """Turns texts into fixed-size vectors."""
+
+    name: str = "base"
+    # True if every vector is non-negative, i.e. cosine similarity is in [0, 1]
+    non_negative: bool = False
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+
+    @abstractmethod
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """float32 matrix with one embedding per text, in order."""
+
+
+class LiteLLMEmbeddingBackend(EmbeddingBackend):
+    """Remote embedding model via litellm; only uncached texts are sent."""
+
+    name = "litellm"
+
+    def __init__(self, model: str, dimensions: int):
+        super().__init__(dimensions)
+        self.model = model
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        cache = get_embedding_cache()
+        embeddings = cache.get_many(texts)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            result = await run_with_retry(
+                litellm_aembedding,
+                model=self.model,
+                input=[texts[i] for i in missing],
+                dimensions=self.dimensions,
+            )
+            fresh = [item["embedding"] for item in result.data]
+            cache.put_many([texts[i] for i in missing], fresh)
+            for i, embedding in zip(missing, fresh):
+                embeddings[i] = embedding
+        return as_matrix(embeddings)
+
+
+class HashingEmbeddingBackend(EmbeddingBackend):
+    """In-process hashed bag of unigrams and bigrams, L2-normalized."""
+
+    name = "local"
+    non_negative = True
+
+    def __init__(self, dimensions: int):
+        super().__init__(dimensions)
+        self._vectorizer = HashingVectorizer(
+            n_features=dimensions,
+            ngram_range=(1, 2),
+            stop_words="english",
+            token_pattern=r"(?u)\b[a-zA-Z][a-zA-Z0-9+#.-]*\b",
+            alternate_sign=False,
+            norm="l2",
+        )
+
+    def embed_sync(self, texts: Sequence[str]) -> np.ndarray:
+        return as_matrix(self._vectorizer.transform(texts).toarray())
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        return self.embed_sync(texts)
+
+
+@lru_cache(maxsize=8)
+def _make_backend(kind: str, model: str, dimensions: int) -> EmbeddingBackend:
+    if kind == "local":
+        return HashingEmbeddingBackend(dimensions)
+    return LiteLLMEmbeddingBackend(model, dimensions)
+
+
+def get_embedding_backend() -> EmbeddingBackend:
+    """Backend selected by EMBEDDING_BACKEND, built once per configuration."""
+    settings = get_settings()
+    return _make_backend(
+        settings.embedding_backend,
+        settings.embedding_model,
+        settings.embedding_output_dimensionality,
+    )
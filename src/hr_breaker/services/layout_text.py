@@ -0,0 +1,34 @@
+"""Text extraction straight from WeasyPrint's layout tree.
+
+Produces the same text an ATS gets from the rendered PDF (one line per laid
+out line, in reading order) without serializing and re-parsing the PDF.
+"""
+
+
+def _line_texts(page_box) -> list[str]:
+    from weasyprint.formatting_structure.boxes import LineBox, TextBox
+
+    lines = []
+    # Iterative walk in document order - LLM HTML can nest arbitrarily deep
+    stack = [page_box]
+    while stack:
+        box = stack.pop()
+        if isinstance(box, LineBox):
+            text = "".join(
+                child.text for child in box.descendants() if isinstance(child, TextBox)
+            )
+            if text.strip():
+                lines.append(text)
+            continue
+        stack.extend(reversed(getattr(box, "children", ())))
+    return lines
+
+
+def page_text(page) -> str:
+    """Text of one laid out page, each line terminated by a newline (like PyMuPDF)."""
+    return "".join(f"{line}\n" for line in _line_texts(page._page_box))
+
+
+def document_page_texts(doc) -> list[str]:
+    """Per-page text of a laid out WeasyPrint Document."""
+    return [page_text(page) for page in doc.pages]
@@ -1,50 +1,153 @@
 """PDF text extraction and resume file loading."""
 
+import os
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
 
 import fitz  # pymupdf
 
+from hr_breaker.config import get_settings
 
-def extract_text_from_pdf(pdf_path: Path) -> str:
+# File types picked up by bulk ingestion
+RESUME_SUFFIXES = (".pdf", ".txt", ".md", ".tex")
+
+
+def iter_pdf_pages(
+    source: Path | bytes | memoryview, max_chars: int | None = None
+) -> Iterator[str]:
+    """Yield the text of each PDF page, one page at a time.
+
+    Paths are opened by MuPDF directly, which reads pages from disk on demand
+    instead of loading the whole file into Python memory. Extraction stops once
+    `max_chars` characters have been yielded (the last page is cut to fit);
+    None or 0 means no limit.
+
+    Args:
+        source: Path to a PDF file, or its bytes
+        max_chars: Character budget across all pages
+    """
+    if isinstance(source, (str, Path)):
+        doc = fitz.open(source)
+    else:
+        doc = fitz.open(stream=source, filetype="pdf")
+
+    try:
+        remaining = max_chars or None
+        for page in doc:
+            text = page.get_text()
+            if remaining is not None:
+                text = text[:remaining]
+                remaining -= len(text)
+            yield text
+            if remaining == 0:
+                return
+    finally:
+        doc.close()
+
+
+def extract_text_from_pdf(pdf_path: Path, max_chars: int | None = None) -> str:
     """Extract text from PDF file.
 
     Args:
         pdf_path: Path to PDF file
+        max_chars: Stop after this many characters (default: no limit)
 
     Returns:
         Extracted text content
     """
-    doc = fitz.open(pdf_path)
-    text_parts = []
-
-    for page in doc:
-        text_parts.append(page.get_text())
+    return "\n".join(iter_pdf_pages(pdf_path, max_chars))
 
-    doc.close()
-    return "\n".join(text_parts)
 
-
-def extract_text_from_pdf_bytes(data: bytes) -> str:
+def extract_text_from_pdf_bytes(
+    data: bytes | memoryview, max_chars: int | None = None
+) -> str:
     """Extract text from PDF bytes."""
-    doc = fitz.open(stream=data, filetype="pdf")
-    text_parts = []
-
-    for page in doc:
-        text_parts.append(page.get_text())
-
-    doc.close()
-    return "\n".join(text_parts)
+    return "\n".join(iter_pdf_pages(data, max_chars))
 
 
 def load_resume_content(path: Path) -> str:
     """Load resume content from a file, extracting text from PDFs."""
     if path.suffix.lower() == ".pdf":
-        return extract_text_from_pdf(path)
+        return extract_text_from_pdf(path, get_settings().resume_extract_max_chars)
     return path.read_text()
 
 
-def load_resume_content_from_upload(filename: str, data: bytes) -> str:
+def load_resume_content_from_upload(filename: str, data: bytes | memoryview) -> str:
     """Load resume content from uploaded file bytes."""
     if filename.lower().endswith(".pdf"):
-        return extract_text_from_pdf_bytes(data)
-    return data.decode("utf-8")
+        return extract_text_from_pdf_bytes(data, get_settings().resume_extract_max_chars)
+    return bytes(data).decode("utf-8")
+
+
+@dataclass
+class IngestedResume:
+    """One resume from a batch: its text, or why it could not be loaded."""
+
+    name: str
+    content: str | None = None
+    error: str | None = None
+
+
+def _ingest_one(name: str, item: Path | bytes) -> IngestedResume:
+    try:
+        if isinstance(item, Path):
+            content = load_resume_content(item)
+        else:
+            content = load_resume_content_from_upload(name, item)
+    except Exception as e:
+        return IngestedResume(name=name, error=f"{type(e).__name__}: {e}")
+    if not content.strip():
+        return IngestedResume(name=name, error="No text extracted (scanned PDF?)")
+    return IngestedResume(name=name, content=content)
+
+
+def _iter_sources(source: Path) -> Iterator[tuple[str, Path | bytes]]:
+    """Yield (name, path or bytes) for every resume file in a directory or .zip."""
+    if source.is_dir():
+        for path in sorted(source.rglob("*")):
+            if path.is_file() and path.suffix.lower() in RESUME_SUFFIXES:
+                yield str(path), path
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not info.filename.lower().endswith(RESUME_SUFFIXES):
+                    continue
+                yield info.filename, archive.read(info)
+    else:
+        raise ValueError(f"Not a directory or zip archive: {source}")
+
+
+def ingest_resumes(source: Path, workers: int | None = None) -> Iterator[IngestedResume]:
+    """Extract text from every resume in a directory or zip archive.
+
+    Files are parsed in a process pool and results are yielded as they finish
+    (not in input order). Only a few files per worker are in flight at once,
+    so large archives are never fully loaded into memory.
+
+    Args:
+        source: Directory (searched recursively) or .zip archive
+        workers: Worker processes (default: CPU count, 1 = serial in this process)
+    """
+    items = _iter_sources(source)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for name, item in items:
+            yield _ingest_one(name, item)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        max_in_flight = workers * 4
+        pending = set()
+        for name, item in items:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(pool.submit(_ingest_one, name, item))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
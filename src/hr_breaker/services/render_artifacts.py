@@ -0,0 +1,180 @@
+"""Render artifact bundle - parse the rendered PDF once, derive everything from it."""
+
+import threading
+
+import fitz  # pymupdf
+
+from hr_breaker.config import get_settings
+from hr_breaker.models import OptimizedResume
+from hr_breaker.models.resume_data import RenderResult
+from hr_breaker.services.renderer import RenderError, get_renderer
+
+
+_MEDIA_TYPES = {"png": "image/png", "jpeg": "image/jpeg", "webp": "image/webp"}
+
+
+def vision_media_type(fmt: str | None = None) -> str:
+    """MIME type of page images produced by rasterize_page."""
+    return _MEDIA_TYPES[fmt or get_settings().vision_image_format]
+
+
+def rasterize_page(
+    page: "fitz.Page",
+    *,
+    dpi: int | None = None,
+    fmt: str | None = None,
+    quality: int | None = None,
+    grayscale: bool | None = None,
+    max_dim: int | None = None,
+) -> bytes:
+    """Rasterize a PDF page to image bytes for vision models.
+
+    Options default to the VISION_IMAGE_* settings. `max_dim` caps the longer
+    side in pixels by lowering the DPI, so the page is never upscaled.
+    """
+    settings = get_settings()
+    dpi = dpi if dpi is not None else settings.vision_image_dpi
+    fmt = fmt or settings.vision_image_format
+    quality = quality if quality is not None else settings.vision_image_quality
+    if grayscale is None:
+        grayscale = settings.vision_image_grayscale
+    max_dim = max_dim if max_dim is not None else settings.vision_image_max_dim
+
+    if fmt not in _MEDIA_TYPES:
+        raise ValueError(f"Unsupported image format: {fmt}")
+
+    if max_dim > 0:
+        longest_pt = max(page.rect.width, page.rect.height)
+        # At least 1 DPI, or a tiny max_dim would ask PyMuPDF for 0 DPI
+        dpi = max(1, min(dpi, int(max_dim * 72 / longest_pt)))
+
+    pix = page.get_pixmap(
+        dpi=dpi, colorspace=fitz.csGRAY if grayscale else fitz.csRGB
+    )
+    if fmt == "png":
+        return pix.tobytes("png")
+    if fmt == "jpeg":
+        return pix.tobytes("jpg", jpg_quality=quality)
+    # WebP goes through Pillow (installed with WeasyPrint)
+    return pix.pil_tobytes(format="WEBP", quality=quality)
+
+
+class RenderArtifacts:
+    """Everything derived from one render: PDF bytes, page stats, text, image.
+
+    The PDF is opened with PyMuPDF at most once. Per-page text and the
+    first-page image are computed lazily on first access and kept, so
+    filters and agents share them instead of re-parsing the PDF.
+    """
+
+    def __init__(
+        self,
+        pdf_bytes: bytes,
+        page_count: int,
+        warnings: list[str] | None = None,
+        html: str | None = None,
+        page_texts: list[str] | None = None,
+    ):
+        self.pdf_bytes = pdf_bytes
+        self.html = html  # HTML body this was rendered from (None for data mode)
+        self.page_count = page_count
+        self.warnings = list(warnings or [])
+        self._doc: fitz.Document | None = None
+        self._page_texts = page_texts
+        self._page_image: bytes | None = None
+        self._page_image_type: str | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_result(
+        cls, result: RenderResult, html: str | None = None
+    ) -> "RenderArtifacts":
+        # Layout text mode: reuse the text WeasyPrint produced while rendering
+        page_texts = None
+        if get_settings().render_text_extraction == "layout" and result.page_texts:
+            page_texts = result.page_texts
+        return cls(
+            pdf_bytes=result.pdf_bytes,
+            page_count=result.page_count,
+            warnings=result.warnings,
+            html=html,
+            page_texts=page_texts,
+        )
+
+    def _document(self) -> "fitz.Document":
+        if self._doc is None:
+            self._doc = fitz.open(stream=self.pdf_bytes, filetype="pdf")
+        return self._doc
+
+    @property
+    def page_texts(self) -> list[str]:
+        """Text of each page, as an ATS would extract it.
+
+        From the layout tree when RENDER_TEXT_EXTRACTION=layout, otherwise
+        parsed from the PDF with PyMuPDF.
+        """
+        with self._lock:
+            if self._page_texts is None:
+                self._page_texts = [page.get_text() for page in self._document()]
+            return self._page_texts
+
+    @property
+    def text(self) -> str:
+        """Full document text, pages joined by newlines."""
+        return "\n".join(self.page_texts)
+
+    @property
+    def page_chars(self) -> list[int]:
+        """Length of each page's stripped text."""
+        return [len(text.strip()) for text in self.page_texts]
+
+    @property
+    def page_image_media_type(self) -> str:
+        """MIME type of page_image()."""
+        return self._page_image_type or vision_media_type()
+
+    def page_image(self) -> bytes:
+        """First page rasterized per the VISION_IMAGE_* settings."""
+        with self._lock:
+            if self._page_image is None:
+                self._page_image_type = vision_media_type()
+                self._page_image = rasterize_page(self._document()[0])
+            return self._page_image
+
+    def close(self) -> None:
+        """Release the parsed document; computed text/image stay available.
+
+        Safe to call early: the PDF is re-opened if something not yet derived
+        is needed later.
+        """
+        with self._lock:
+            if self._doc is not None:
+                self._doc.close()
+                self._doc = None
+
+
+def current_artifacts(optimized: OptimizedResume) -> RenderArtifacts | None:
+    """Artifacts attached to `optimized`, if they were rendered from its content."""
+    artifacts = optimized.artifacts
+    if artifacts is None or artifacts.html != optimized.html:
+        return None
+    return artifacts
+
+
+async def ensure_artifacts(optimized: OptimizedResume) -> RenderArtifacts:
+    """Reuse the orchestration's render of `optimized`, rendering only if missing.
+
+    Raises RenderError if there is nothing to render or rendering fails.
+    """
+    artifacts = current_artifacts(optimized)
+    if artifacts is not None:
+        return artifacts
+
+    renderer = get_renderer()
+    if optimized.html is not None:
+        result = await renderer.render_async(optimized.html)
+    elif optimized.data is not None:
+        result = await renderer.render_data_async(optimized.data)
+    else:
+        raise RenderError("No content to render (neither html nor data)")
+    return RenderArtifacts.from_result(result, html=optimized.html)
@@ -0,0 +1,277 @@
+"""Sandboxed rendering backend - WeasyPrint layouts run in guarded worker processes.
+
+LLM-generated HTML is untrusted: a runaway stylesheet or a huge table can pin
+a core for minutes or exhaust memory. Each worker is a long-lived process that
+renders one document at a time; a render that exceeds the wall-clock timeout
+or the RSS limit gets its worker killed and replaced, and surfaces as a
+RenderError. Other renders in flight are unaffected.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+import weakref
+from functools import lru_cache
+
+from hr_breaker.config import get_settings, logger
+from hr_breaker.models.resume_data import RenderResult, ResumeData
+
+# Exit code of a worker killed by its own memory watchdog
+_EXIT_MEMORY = 3
+_WATCHDOG_INTERVAL = 0.05
+# Worker start-up (imports, font discovery) is not counted against render_timeout
+_STARTUP_TIMEOUT = 120.0
+
+
+def _default_renderer():
+    from hr_breaker.services.renderer import HTMLRenderer, RenderCache
+
+    # The parent process owns caching; workers only lay out
+    return HTMLRenderer(cache=RenderCache(max_entries=0))
+
+
+def _rss_bytes() -> int:
+    """Current resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # No procfs (macOS): fall back to peak RSS
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _watch_memory(limit_bytes: int) -> None:
+    while True:
+        if _rss_bytes() > limit_bytes:
+            os._exit(_EXIT_MEMORY)
+        time.sleep(_WATCHDOG_INTERVAL)
+
+
+def _worker_main(conn, memory_limit_mb: int, renderer_factory) -> None:
+    """Worker loop: build the renderer once, then serve (method, payload) requests."""
+    from hr_breaker.services.renderer import RenderError
+
+    renderer = renderer_factory()
+    if memory_limit_mb > 0:
+        threading.Thread(
+            target=_watch_memory, args=(memory_limit_mb * 1024 * 1024,), daemon=True
+        ).start()
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            method, payload = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send(("ok", getattr(renderer, method)(payload)))
+        except MemoryError:
+            os._exit(_EXIT_MEMORY)
+        except RenderError as e:
+            conn.send(("error", str(e)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    """One sandboxed render process, talking to the parent over a pipe."""
+
+    def __init__(self, ctx, memory_limit_mb: int, renderer_factory):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_mb, renderer_factory),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+
+    def wait_ready(self) -> None:
+        """Block until the worker has built its renderer."""
+        if self.ready:
+            return
+        if not self.conn.poll(_STARTUP_TIMEOUT):
+            raise TimeoutError
+        self.conn.recv()
+        self.ready = True
+
+    def call(self, method: str, payload, timeout: float):
+        """Send one request and wait for the reply.
+
+        Raises TimeoutError if no reply arrives in time, EOFError if the
+        worker died.
+        """
+        self.conn.send((method, payload))
+        if not self.conn.poll(timeout):
+            raise TimeoutError
+        return self.conn.recv()
+
+    def exit_code(self) -> int | None:
+        self.process.join(timeout=1)
+        return self.process.exitcode
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class RenderPool:
+    """Pool of warm, sandboxed worker processes for HTML -> PDF rendering.
+
+    Callers await `render()`; at most `max_pending` renders per event loop are
+    queued at once. Each render is bounded by `timeout` seconds of wall-clock
+    time and each worker by `memory_limit_mb` of RSS (0 = unlimited).
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        timeout: float,
+        max_pending: int,
+        memory_limit_mb: int = 0,
+        renderer_factory=_default_renderer,
+    ):
+        self.workers = workers
+        self.timeout = timeout
+        self.max_pending = max_pending if max_pending > 0 else workers * 2
+        self.memory_limit_mb = memory_limit_mb
+        self.renderer_factory = renderer_factory
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: queue.SimpleQueue[_Worker] = queue.SimpleQueue()
+        self._started = 0
+        self._lock = threading.Lock()
+        self._all: set[_Worker] = set()
+        self._slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, self.memory_limit_mb, self.renderer_factory)
+        with self._lock:
+            self._all.add(worker)
+        logger.debug(f"Started render worker pid={worker.process.pid}")
+        return worker
+
+    def _acquire(self) -> _Worker:
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                can_spawn = self._started < self.workers
+                if can_spawn:
+                    self._started += 1
+            if can_spawn:
+                try:
+                    return self._spawn()
+                except Exception:
+                    with self._lock:
+                        self._started -= 1
+                    raise
+            # All workers busy; poll so a killed worker's slot gets respawned
+            try:
+                return self._idle.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    def _discard(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            self._all.discard(worker)
+            self._started -= 1
+
+    def _run_sync(self, method: str, payload):
+        from hr_breaker.services.renderer import RenderError
+
+        worker = self._acquire()
+        try:
+            worker.wait_ready()
+        except (TimeoutError, EOFError, OSError):
+            exit_code = worker.exit_code()
+            self._discard(worker)
+            raise RenderError(
+                f"Render worker failed to start (exit code {exit_code})"
+            ) from None
+        try:
+            status, reply = worker.call(method, payload, self.timeout)
+        except TimeoutError:
+            logger.warning(f"Render exceeded {self.timeout:.0f}s, killing worker")
+            self._discard(worker)
+            raise RenderError(f"Render timed out after {self.timeout:.0f}s") from None
+        except (EOFError, OSError):
+            exit_code = worker.exit_code()
+            self._discard(worker)
+            if exit_code == _EXIT_MEMORY:
+                raise RenderError(
+                    f"Render exceeded memory limit of {self.memory_limit_mb} MB"
+                ) from None
+            raise RenderError(
+                f"Render worker crashed (exit code {exit_code})"
+            ) from None
+
+        self._idle.put(worker)
+        if status == "error":
+            raise RenderError(reply)
+        return reply
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = asyncio.Semaphore(self.max_pending)
+            self._slots[loop] = slots
+        return slots
+
+    async def run(self, method: str, payload):
+        """Run `HTMLRenderer.<method>(payload)` in a sandboxed worker."""
+        async with self._get_slots():
+            return await asyncio.to_thread(self._run_sync, method, payload)
+
+    async def render(self, html_body: str) -> RenderResult:
+        return await self.run("render", html_body)
+
+    async def render_data(self, data: ResumeData) -> RenderResult:
+        """Legacy ResumeData render, under the same timeout and memory limit."""
+        return await self.run("render_data", data)
+
+    def warm_up(self) -> None:
+        """Start all worker processes now instead of on first render."""
+        while True:
+            with self._lock:
+                if self._started >= self.workers:
+                    return
+                self._started += 1
+            self._idle.put(self._spawn())
+
+    def shutdown(self) -> None:
+        with self._lock:
+            workers, self._all = self._all, set()
+            self._started = 0
+        self._idle = queue.SimpleQueue()
+        for worker in workers:
+            worker.kill()
+
+
+@lru_cache
+def get_render_pool() -> RenderPool | None:
+    """Get the process-wide render pool, or None if RENDER_WORKERS is 0."""
+    settings = get_settings()
+    if settings.render_workers <= 0:
+        return None
+    return RenderPool(
+        workers=settings.render_workers,
+        timeout=settings.render_timeout,
+        max_pending=settings.render_max_pending,
+        memory_limit_mb=settings.render_memory_limit_mb,
+    )
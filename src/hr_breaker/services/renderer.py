@@ -1,17 +1,29 @@
 """Abstract renderer interface and implementations."""
 
+import asyncio
+import hashlib
+import json
 import os
+import re
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
 
-from hr_breaker.models.resume_data import ResumeData, RenderResult
+from hr_breaker.config import get_settings, logger
+from hr_breaker.models.resume_data import RenderMeasurement, RenderResult, ResumeData
+from hr_breaker.services.layout_text import document_page_texts
 
 # Template directory
 TEMPLATE_DIR = Path(__file__).parent.parent.parent.parent / "templates"
 
+_STYLE_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.DOTALL | re.IGNORECASE)
+
 
 def _setup_macos_library_path():
     """Set up library path for WeasyPrint on macOS with Homebrew."""
@@ -41,6 +53,192 @@ class RenderError(Exception):
     pass
 
 
+def _page_count_warnings(page_count: int) -> list[str]:
+    if page_count > 1:
+        return [f"Resume is {page_count} pages, should be 1 page"]
+    return []
+
+
+def _page_chars(page_texts: list[str]) -> list[int]:
+    return [len(text.strip()) for text in page_texts]
+
+
+class RenderCache:
+    """Bounded LRU cache of render results keyed by content hash.
+
+    Identical HTML (wrapped with the same template) is laid out once per
+    process. The in-memory tier is bounded by entry count, not bytes (a
+    one-page resume PDF is typically tens of KB). An optional on-disk tier
+    keeps full RenderResults (not measurements) across processes and is
+    pruned oldest-first once it exceeds `disk_max_bytes` (0 = unbounded).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        disk_dir: Path | None = None,
+        disk_max_bytes: int = 0,
+    ):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, RenderResult | RenderMeasurement] = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir is not None:
+            disk_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(content: str, template_version: str) -> str:
+        """Hash rendered document content together with the template version."""
+        digest = hashlib.sha256(template_version.encode())
+        digest.update(b"\0")
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(
+        self, key: str, *, record: bool = True, disk: bool = True
+    ) -> RenderResult | RenderMeasurement | None:
+        """Look up `key` in memory, then on disk.
+
+        `record=False` leaves the hit/miss counters alone, for callers that
+        make one logical lookup out of several keys (see `record`).
+        `disk=False` skips the disk tier, e.g. for measurements, which are
+        never written there.
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                if record:
+                    self.hits += 1
+                return result
+
+        result = self._disk_get(key) if disk else None
+        with self._lock:
+            if result is None:
+                if record:
+                    self.misses += 1
+                return None
+            if record:
+                self.hits += 1
+            self._store(key, result)
+        return result
+
+    def record(self, hit: bool) -> None:
+        """Count one logical lookup made with `get(..., record=False)`."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def put(self, key: str, result: RenderResult | RenderMeasurement) -> None:
+        with self._lock:
+            self._store(key, result)
+        if isinstance(result, RenderResult):
+            self._disk_put(key, result)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: str, result: RenderResult | RenderMeasurement) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_get(self, key: str) -> RenderResult | None:
+        if self.disk_dir is None:
+            return None
+        pdf_path = self.disk_dir / f"{key}.pdf"
+        meta_path = self.disk_dir / f"{key}.json"
+        if not (pdf_path.exists() and meta_path.exists()):
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            result = RenderResult(pdf_bytes=pdf_path.read_bytes(), **meta)
+            # Refresh mtime so pruning evicts least recently used entries
+            os.utime(meta_path)
+            return result
+        except (OSError, json.JSONDecodeError, TypeError, ValueError):
+            return None
+
+    def _disk_put(self, key: str, result: RenderResult) -> None:
+        if self.disk_dir is None:
+            return
+        try:
+            (self.disk_dir / f"{key}.pdf").write_bytes(result.pdf_bytes)
+            # Metadata written last - its presence marks a complete entry
+            (self.disk_dir / f"{key}.json").write_text(
+                result.model_dump_json(exclude={"pdf_bytes"}), encoding="utf-8"
+            )
+        except OSError as e:
+            logger.warning(f"Render cache disk write failed: {e}")
+            return
+        self._disk_prune()
+
+    def _disk_prune(self) -> None:
+        """Delete the oldest entries (by metadata mtime) beyond disk_max_bytes."""
+        if self.disk_dir is None or self.disk_max_bytes <= 0:
+            return
+        entries = []
+        total = 0
+        for meta_path in self.disk_dir.glob("*.json"):
+            pdf_path = meta_path.with_suffix(".pdf")
+            try:
+                stat = meta_path.stat()
+                size = stat.st_size + pdf_path.stat().st_size
+            except OSError:
+                continue  # Incomplete or concurrently removed entry
+            entries.append((stat.st_mtime, size, meta_path, pdf_path))
+            total += size
+        if total <= self.disk_max_bytes:
+            return
+
+        entries.sort(key=lambda e: e[0])
+        removed = 0
+        for _, size, meta_path, pdf_path in entries:
+            if total <= self.disk_max_bytes:
+                break
+            # Metadata first, so a half-deleted entry is never read as complete
+            meta_path.unlink(missing_ok=True)
+            pdf_path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        logger.debug(f"Render cache pruned {removed} disk entries")
+
+
+@lru_cache
+def get_render_cache() -> RenderCache:
+    """Get the process-wide render cache."""
+    settings = get_settings()
+    return RenderCache(
+        max_entries=settings.render_cache_max_entries,
+        disk_dir=settings.render_cache_dir,
+        disk_max_bytes=settings.render_cache_dir_max_mb * 1024 * 1024,
+    )
+
+
 class BaseRenderer(ABC):
     """Abstract base class for resume renderers."""
 
@@ -54,16 +252,40 @@ class HTMLRenderer(BaseRenderer):
     """Render resume using HTML + WeasyPrint."""
 
     _weasyprint_imported = False
+    # WeasyPrint/Pango are not thread-safe; parallelism comes from the process pool
+    _layout_lock = threading.Lock()
 
-    def __init__(self):
+    def __init__(self, cache: RenderCache | None = None):
         self._ensure_weasyprint()
         self.env = Environment(
             loader=FileSystemLoader(TEMPLATE_DIR),
             autoescape=True,
         )
+        from weasyprint import CSS
         from weasyprint.text.fonts import FontConfiguration
         self.font_config = FontConfiguration()
-        self._wrapper_html = (TEMPLATE_DIR / "resume_wrapper.html").read_text(encoding="utf-8")
+        wrapper_html = (TEMPLATE_DIR / "resume_wrapper.html").read_text(encoding="utf-8")
+        # Parse the wrapper's CSS once; each render only parses the body HTML
+        self.wrapper_css = CSS(
+            string="\n".join(_STYLE_RE.findall(wrapper_html)),
+            base_url=str(TEMPLATE_DIR),
+            font_config=self.font_config,
+        )
+        self._wrapper_html = _STYLE_RE.sub("", wrapper_html)
+        self._data_css = None
+        self.cache = cache if cache is not None else get_render_cache()
+        self.template_version = self._compute_template_version()
+
+    def _compute_template_version(self) -> str:
+        """Hash everything besides the body that affects rendered output."""
+        import weasyprint
+
+        digest = hashlib.sha256(weasyprint.__version__.encode())
+        for name in ("resume_wrapper.html", "resume.html", "resume.css"):
+            path = TEMPLATE_DIR / name
+            if path.exists():
+                digest.update(path.read_bytes())
+        return digest.hexdigest()[:16]
 
     @classmethod
     def _ensure_weasyprint(cls):
@@ -106,61 +328,218 @@ class HTMLRenderer(BaseRenderer):
                 raise RenderError(msg) from e
             raise
 
+    def _document(self, html_body: str) -> str:
+        """Wrap LLM's body content with our template."""
+        return self._wrapper_html.replace("{{BODY}}", html_body)
+
+    def _render_key(self, html_body: str) -> str:
+        return RenderCache.make_key(self._document(html_body), self.template_version)
+
+    def _measure_key(self, html_body: str) -> str:
+        return RenderCache.make_key(
+            self._document(html_body), f"{self.template_version}:measure"
+        )
+
     def render(self, html_body: str) -> RenderResult:
         """Render LLM-generated HTML body to PDF.
 
         Args:
             html_body: HTML content for the <body> (no wrapper needed)
         """
+        key = self._render_key(html_body)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._render_uncached(html_body)
+        self.cache.put(key, result)
+        return result
+
+    async def render_async(self, html_body: str) -> RenderResult:
+        """Render without blocking the event loop.
+
+        Runs in the worker process pool when RENDER_WORKERS > 0, where a
+        render over RENDER_TIMEOUT raises RenderError. Otherwise runs in a
+        thread with no time limit (see `_run_async`).
+        """
+        key = self._render_key(html_body)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = await self._run_async("render", html_body)
+        self.cache.put(key, result)
+        return result
+
+    def measure(self, html_body: str) -> RenderMeasurement:
+        """Lay out HTML body and return page stats without writing a PDF.
+
+        Much cheaper than render() when only the page count matters.
+        """
+        cached = self._cached_measurement(html_body)
+        if cached is not None:
+            return cached
+
+        measurement = self._measure_uncached(html_body)
+        self.cache.put(self._measure_key(html_body), measurement)
+        return measurement
+
+    async def measure_async(self, html_body: str) -> RenderMeasurement:
+        """measure() without blocking the event loop (see render_async)."""
+        cached = self._cached_measurement(html_body)
+        if cached is not None:
+            return cached
+
+        measurement = await self._run_async("measure", html_body)
+        self.cache.put(self._measure_key(html_body), measurement)
+        return measurement
+
+    def _cached_measurement(self, html_body: str) -> RenderMeasurement | None:
+        # One logical lookup: a full render of the same body already has the
+        # page stats, else a measurement (memory only, never on disk)
+        rendered = self.cache.get(self._render_key(html_body), record=False)
+        if rendered is not None and len(rendered.page_chars) == rendered.page_count:
+            self.cache.record(hit=True)
+            return RenderMeasurement(
+                page_count=rendered.page_count,
+                page_chars=rendered.page_chars,
+                warnings=rendered.warnings,
+            )
+        measurement = self.cache.get(
+            self._measure_key(html_body), record=False, disk=False
+        )
+        self.cache.record(hit=measurement is not None)
+        return measurement
+
+    async def _run_async(self, method: str, payload):
+        """Run render/measure/render_data in the worker pool, or in a thread if disabled.
+
+        The thread fallback cannot cancel a layout: giving up on it would
+        leave it running while holding `_layout_lock`, stalling every later
+        render behind it. So no timeout is applied there; untrusted HTML
+        needs RENDER_WORKERS > 0.
+        """
+        from hr_breaker.services.render_pool import get_render_pool
+
+        pool = get_render_pool()
+        if pool is not None:
+            return await pool.run(method, payload)
+
+        return await asyncio.to_thread(getattr(self, f"_{method}_uncached"), payload)
+
+    def _layout(self, html_body: str):
         from weasyprint import HTML
 
-        # Wrap LLM's body content with our template
-        html_content = self._wrapper_html.replace("{{BODY}}", html_body)
+        html = HTML(string=self._document(html_body), base_url=str(TEMPLATE_DIR))
+        return html.render(stylesheets=[self.wrapper_css], font_config=self.font_config)
 
-        # Render with WeasyPrint
-        html = HTML(string=html_content, base_url=str(TEMPLATE_DIR))
-        doc = html.render(font_config=self.font_config)
-        pdf_bytes = doc.write_pdf()
+    def _render_uncached(self, html_body: str) -> RenderResult:
+        # Render with WeasyPrint (one layout at a time per process)
+        with self._layout_lock:
+            doc = self._layout(html_body)
+            pdf_bytes = doc.write_pdf()
         page_count = len(doc.pages)
-
-        warnings = []
-        if page_count > 1:
-            warnings.append(f"Resume is {page_count} pages, should be 1 page")
+        page_texts = document_page_texts(doc)
 
         return RenderResult(
             pdf_bytes=pdf_bytes,
             page_count=page_count,
-            warnings=warnings,
+            warnings=_page_count_warnings(page_count),
+            page_chars=_page_chars(page_texts),
+            page_texts=page_texts,
+        )
+
+    def _measure_uncached(self, html_body: str) -> RenderMeasurement:
+        with self._layout_lock:
+            doc = self._layout(html_body)
+        page_count = len(doc.pages)
+
+        return RenderMeasurement(
+            page_count=page_count,
+            page_chars=_page_chars(document_page_texts(doc)),
+            warnings=_page_count_warnings(page_count),
         )
 
+    def _data_document(self, data: ResumeData) -> str:
+        return self.env.get_template("resume.html").render(resume=data)
+
     def render_data(self, data: ResumeData) -> RenderResult:
         """Legacy: Render ResumeData to PDF via Jinja template."""
+        key = RenderCache.make_key(self._data_document(data), self.template_version)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._render_data_uncached(data)
+        self.cache.put(key, result)
+        return result
+
+    async def render_data_async(self, data: ResumeData) -> RenderResult:
+        """render_data() without blocking the event loop (see render_async)."""
+        key = RenderCache.make_key(self._data_document(data), self.template_version)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = await self._run_async("render_data", data)
+        self.cache.put(key, result)
+        return result
+
+    def _render_data_uncached(self, data: ResumeData) -> RenderResult:
         from weasyprint import HTML, CSS
 
-        template = self.env.get_template("resume.html")
-        html_content = template.render(resume=data)
-
-        html = HTML(string=html_content, base_url=str(TEMPLATE_DIR))
+        html = HTML(string=self._data_document(data), base_url=str(TEMPLATE_DIR))
         css_path = TEMPLATE_DIR / "resume.css"
-        stylesheets = []
-        if css_path.exists():
-            stylesheets.append(CSS(filename=str(css_path), font_config=self.font_config))
+        if self._data_css is None and css_path.exists():
+            self._data_css = CSS(filename=str(css_path), font_config=self.font_config)
+        stylesheets = [self._data_css] if self._data_css is not None else []
 
-        doc = html.render(stylesheets=stylesheets, font_config=self.font_config)
-        pdf_bytes = doc.write_pdf()
+        with self._layout_lock:
+            doc = html.render(stylesheets=stylesheets, font_config=self.font_config)
+            pdf_bytes = doc.write_pdf()
         page_count = len(doc.pages)
-
-        warnings = []
-        if page_count > 1:
-            warnings.append(f"Resume is {page_count} pages, should be 1 page")
+        page_texts = document_page_texts(doc)
 
         return RenderResult(
             pdf_bytes=pdf_bytes,
             page_count=page_count,
-            warnings=warnings,
+            warnings=_page_count_warnings(page_count),
+            page_chars=_page_chars(page_texts),
+            page_texts=page_texts,
         )
 
 
+_shared_renderer: HTMLRenderer | None = None
+_shared_renderer_lock = threading.Lock()
+
+
 def get_renderer() -> HTMLRenderer:
-    """Get the HTML renderer."""
-    return HTMLRenderer()
+    """Get the process-wide shared HTML renderer, built on first use.
+
+    Fonts, templates and the render cache are loaded once and shared by the
+    CLI, Streamlit and every filter and agent.
+    """
+    global _shared_renderer
+    if _shared_renderer is None:
+        with _shared_renderer_lock:
+            if _shared_renderer is None:
+                _shared_renderer = HTMLRenderer()
+    return _shared_renderer
+
+
+def warm_up_renderer() -> HTMLRenderer:
+    """Build the shared renderer and run one small layout.
+
+    Call at startup so WeasyPrint import and font discovery don't land on the
+    first real render. Also starts render pool workers if configured.
+    """
+    from hr_breaker.services.render_pool import get_render_pool
+
+    start = time.perf_counter()
+    renderer = get_renderer()
+    renderer.measure('<header class="header"><h1 class="name">Warm-up</h1></header>')
+    logger.debug(f"warm_up_renderer: {time.perf_counter() - start:.2f}s")
+    pool = get_render_pool()
+    if pool is not None:
+        pool.warm_up()
+    return renderer
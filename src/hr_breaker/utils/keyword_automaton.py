@@ -0,0 +1,81 @@
+"""Aho-Corasick multi-keyword matcher with regex word-boundary semantics."""
+
+from collections import deque
+from collections.abc import Iterable
+
+
+def _is_word(ch: str) -> bool:
+    # Same definition as `\w` in a str regex
+    return ch.isalnum() or ch == "_"
+
+
+def _at_boundary(text: str, pos: int) -> bool:
+    """True where `\\b` would match at `pos` in `text`."""
+    before = pos > 0 and _is_word(text[pos - 1])
+    after = pos < len(text) and _is_word(text[pos])
+    return before != after
+
+
+class KeywordAutomaton:
+    """Find which of many keywords occur in a text, in a single scan.
+
+    A keyword counts as found when it occurs with `\\b` on both sides, i.e.
+    exactly when `re.search(rf"\\b{re.escape(keyword)}\\b", text)` would match.
+    The automaton is compiled once; each scan is linear in the text length
+    regardless of how many keywords there are.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(kw for kw in keywords if kw))
+
+        # Trie of all keywords
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    goto.append({})
+                    outputs.append([])
+                    nxt = len(goto) - 1
+                    goto[state][ch] = nxt
+                state = nxt
+            outputs[state].append(index)
+
+        # Failure links in BFS order, folded into a full transition table so
+        # a scan does one dict lookup per character
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0) if state else 0
+                outputs[child] = outputs[child] + outputs[fail[child]]
+                queue.append(child)
+
+        self._delta = delta
+        self._outputs = outputs
+
+    def find(self, text: str) -> set[str]:
+        """Keywords occurring in `text` as whole words."""
+        delta = self._delta
+        outputs = self._outputs
+        keywords = self.keywords
+        found: set[int] = set()
+
+        state = 0
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch, 0)
+            if not outputs[state]:
+                continue
+            for index in outputs[state]:
+                if index in found:
+                    continue
+                start = end - len(keywords[index])
+                if _at_boundary(text, start) and _at_boundary(text, end):
+                    found.add(index)
+
+        return {keywords[index] for index in found}
@@ -0,0 +1,20 @@
+"""Prompt layout for provider-side prompt caching."""
+
+from pydantic_ai.messages import CachePoint
+
+from hr_breaker.config import get_settings
+
+
+def cacheable_prompt(prefix: str, suffix: str, *attachments) -> str | list:
+    """User prompt with a cache point between the static prefix and the rest.
+
+    `prefix` must be byte-identical across calls (e.g. job and original
+    resume) for the provider to reuse it. Without PROMPT_CACHE this is just
+    the joined text (plus any attachments).
+    """
+    if get_settings().prompt_cache:
+        parts = [prefix, CachePoint(), suffix]
+    else:
+        parts = [prefix + suffix]
+    parts.extend(attachments)
+    return parts[0] if len(parts) == 1 else parts
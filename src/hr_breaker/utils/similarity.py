@@ -0,0 +1,71 @@
+"""Cosine similarity over contiguous float32 embedding matrices."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+
+def as_matrix(vectors) -> np.ndarray:
+    """Stack vectors into a C-contiguous float32 matrix (one row per vector)."""
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return matrix
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row; all-zero rows stay zero (similarity 0)."""
+    matrix = as_matrix(matrix)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def similarity_matrix(rows, columns) -> np.ndarray:
+    """Cosine similarity of every row vector with every column vector.
+
+    E.g. resumes x jobs: one matrix product however many of each.
+    """
+    return normalize_rows(rows) @ normalize_rows(columns).T
+
+
+def cosine_similarity(a, b) -> float:
+    """Cosine similarity of two vectors (0.0 if either is all zeros)."""
+    return float(similarity_matrix(a, b)[0, 0])
+
+
+class EmbeddingIndex:
+    """Normalized embeddings kept in one float32 matrix for ranking.
+
+    Stores e.g. every job embedding so one resume is scored against all of
+    them (or all resumes against one job) with a single matrix-vector product.
+    """
+
+    def __init__(self, keys: Sequence[str] = (), vectors=None):
+        self.keys: list[str] = list(keys)
+        self._matrix = (
+            normalize_rows(vectors) if vectors is not None else np.zeros((0, 0), np.float32)
+        )
+        if len(self.keys) != len(self._matrix):
+            raise ValueError(f"{len(self.keys)} keys for {len(self._matrix)} vectors")
+
+    def add(self, keys: Sequence[str], vectors) -> None:
+        rows = normalize_rows(vectors)
+        if len(keys) != len(rows):
+            raise ValueError(f"{len(keys)} keys for {len(rows)} vectors")
+        self._matrix = rows if not len(self._matrix) else np.vstack([self._matrix, rows])
+        self.keys.extend(keys)
+
+    def scores(self, queries) -> np.ndarray:
+        """Similarity of each query (rows) with each stored vector (columns)."""
+        if not self.keys:
+            return np.zeros((len(as_matrix(queries)), 0), np.float32)
+        return normalize_rows(queries) @ self._matrix.T
+
+    def rank(self, query, k: int | None = None) -> list[tuple[str, float]]:
+        """Stored keys by descending similarity to one query vector."""
+        scores = self.scores(query)[0]
+        order = np.argsort(-scores, kind="stable")[:k]
+        return [(self.keys[i], float(scores[i])) for i in order]
+
+    def __len__(self) -> int:
+        return len(self.keys)
@@ -1,8 +1,12 @@
 """Pytest configuration."""
 
+from unittest.mock import patch
+
 import pytest
 from dotenv import load_dotenv
 
+from hr_breaker.services.renderer import HTMLRenderer, RenderCache
+
 # Load .env before running tests
 load_dotenv()
 
@@ -14,3 +18,14 @@ def event_loop():
     loop = asyncio.new_event_loop()
     yield loop
     loop.close()
+
+
+@pytest.fixture
+def stub_renderer():
+    """HTMLRenderer without WeasyPrint initialization."""
+    with patch.object(HTMLRenderer, "__init__", lambda self: None):
+        r = HTMLRenderer()
+    r.cache = RenderCache(max_entries=8)
+    r.template_version = "test"
+    r._wrapper_html = "<body>{{BODY}}</body>"
+    return r
@@ -4,15 +4,22 @@ These tests do NOT call LLMs — they only verify that agent factory functions
 run without AttributeError, ImportError, or similar wiring bugs.
 """
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pydantic_ai.models.test import TestModel
+
 from hr_breaker.agents.job_parser import get_job_parser_agent
-from hr_breaker.agents.optimizer import get_optimizer_agent
+from hr_breaker.agents.name_extractor import get_name_extractor_agent
+from hr_breaker.agents.optimizer import OptimizerDeps, get_optimizer_agent
 from hr_breaker.agents.combined_reviewer import get_combined_reviewer_agent
 from hr_breaker.agents.hallucination_detector import get_hallucination_agent
 from hr_breaker.agents.ai_generated_detector import get_ai_generated_agent
 from hr_breaker.agents.translator import get_translator_agent
 from hr_breaker.agents.translation_reviewer import get_translation_reviewer_agent
+from hr_breaker.config import get_pro_model
 from hr_breaker.models import JobPosting, ResumeSource
 from hr_breaker.models.language import get_language
+from hr_breaker.services.renderer import RenderError
 
 
 def test_job_parser_agent():
@@ -20,12 +27,45 @@ def test_job_parser_agent():
 
 
 def test_optimizer_agent():
+    assert get_optimizer_agent() is not None
+    assert get_optimizer_agent(no_shame=True) is not None
+
+
+def test_agents_built_once_per_configuration():
+    assert get_optimizer_agent() is get_optimizer_agent()
+    assert get_optimizer_agent() is not get_optimizer_agent(no_shame=True)
+    assert get_hallucination_agent() is get_hallucination_agent()
+    assert get_name_extractor_agent() is get_name_extractor_agent()
+    assert get_translator_agent(get_language("ru")) is get_translator_agent(get_language("ru"))
+    assert get_pro_model() is get_pro_model()
+
+
+async def test_optimizer_tools_read_job_from_deps():
     job = JobPosting(
         title="Engineer", company="Acme",
         requirements=["Python"], keywords=["python"],
     )
     source = ResumeSource(content="Jane Doe\nPython dev")
-    assert get_optimizer_agent(job, source) is not None
+    agent = get_optimizer_agent()
+    model = TestModel(call_tools=["check_keywords_tool", "validate_structure"])
+    with agent.override(model=model):
+        result = await agent.run("optimize", deps=OptimizerDeps(job=job, source=source))
+    assert result.output is not None
+
+
+async def test_preview_render_failure_goes_back_to_model():
+    job = JobPosting(title="Engineer", company="Acme")
+    source = ResumeSource(content="Jane Doe\nPython dev")
+    renderer = MagicMock()
+    renderer.render_async = AsyncMock(side_effect=RenderError("Render timed out after 60s"))
+    agent = get_optimizer_agent()
+    model = TestModel(call_tools=["preview_resume"])
+    with agent.override(model=model), patch(
+        "hr_breaker.agents.optimizer.get_renderer", return_value=renderer
+    ):
+        result = await agent.run("optimize", deps=OptimizerDeps(job=job, source=source))
+    renderer.render_async.assert_awaited()
+    assert result.output is not None
 
 
 def test_combined_reviewer_agent():
@@ -64,3 +64,23 @@ class TestResumeCache:
 
             result = cache.get("nonexistent")
             assert result is None
+
+    def test_put_many_skips_cached_and_duplicates(self, tmp_path):
+        """Cache.put_many() writes each new resume once and reports the count."""
+        with patch.object(ResumeCache, '__init__', lambda self: None):
+            cache = ResumeCache()
+            cache.cache_dir = tmp_path
+
+            cached = ResumeSource(content="already here")
+            cache.put(cached)
+
+            written = cache.put_many([
+                ResumeSource(content="already here"),
+                ResumeSource(content="new one"),
+                ResumeSource(content="new one"),
+                ResumeSource(content="another"),
+            ])
+
+            assert written == 2
+            assert len(list(tmp_path.glob("*.json"))) == 3
+            assert cache.get(ResumeSource(content="another").checksum) is not None
@@ -0,0 +1,74 @@
+"""Tests for the persistent embedding cache and its use by VectorSimilarityMatcher."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from hr_breaker.config import get_settings
+from hr_breaker.filters import VectorSimilarityMatcher
+from hr_breaker.models import JobPosting, OptimizedResume, ResumeSource
+from hr_breaker.services.embedding_cache import EmbeddingCache, get_embedding_cache
+
+
+def test_round_trip_and_persistence(tmp_path):
+    path = tmp_path / "emb.sqlite3"
+    cache = EmbeddingCache(path, "model-a", 3)
+    assert cache.get_many(["x", "y"]) == [None, None]
+
+    cache.put_many(["x"], [[0.5, -1.0, 2.0]])
+    x, y = cache.get_many(["x", "y"])
+    assert x.tolist() == [0.5, -1.0, 2.0] and y is None
+    cache.close()
+
+    reopened = EmbeddingCache(path, "model-a", 3)
+    assert reopened.get_many(["x"])[0].tolist() == [0.5, -1.0, 2.0]
+    assert len(reopened) == 1
+
+
+def test_scoped_per_model_and_dimensions(tmp_path):
+    path = tmp_path / "emb.sqlite3"
+    EmbeddingCache(path, "model-a", 3).put_many(["x"], [[1.0, 2.0, 3.0]])
+
+    assert EmbeddingCache(path, "model-b", 3).get_many(["x"]) == [None]
+    assert EmbeddingCache(path, "model-a", 2).get_many(["x"]) == [None]
+
+
+def test_vectors_stored_as_float32():
+    cache = EmbeddingCache(None, "m", 2)
+    cache.put_many(["x"], [[0.1, 0.2]])
+    got = cache.get_many(["x"])[0]
+    assert got.dtype == np.float32
+    np.testing.assert_array_equal(got, np.asarray([0.1, 0.2], dtype=np.float32))
+    assert cache.get_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_matcher_only_embeds_new_texts(monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "embedding_cache_path", tmp_path / "emb.sqlite3")
+    monkeypatch.setattr(get_settings(), "embedding_output_dimensionality", 2)
+    job = JobPosting(title="Engineer", company="Acme", requirements=["Python"])
+    source = ResumeSource(content="resume")
+
+    def fake_embedding(**kwargs):
+        return SimpleNamespace(
+            data=[{"embedding": [1.0, float(len(text) % 3)]} for text in kwargs["input"]]
+        )
+
+    aembedding = AsyncMock(side_effect=fake_embedding)
+    matcher = VectorSimilarityMatcher()
+    with patch(
+        "hr_breaker.services.embeddings.litellm_aembedding", aembedding
+    ):
+        for text in ("first draft", "second draft", "second draft"):
+            optimized = OptimizedResume(
+                html="<p></p>", pdf_text=text, source_checksum=source.checksum
+            )
+            await matcher.evaluate(optimized, job, source)
+
+    inputs = [call.kwargs["input"] for call in aembedding.await_args_list]
+    assert len(inputs) == 2
+    assert len(inputs[0]) == 2  # resume + job
+    assert inputs[1] == ["second draft"]  # job embedding reused
+    assert get_embedding_cache().stats["hits"] == 3
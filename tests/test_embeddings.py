@@ -0,0 +1,76 @@
+"""Tests for embedding backend selection and the local hashing backend."""
+
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from hr_breaker.config import get_settings
+from hr_breaker.filters import VectorSimilarityMatcher
+from hr_breaker.models import JobPosting, OptimizedResume, ResumeSource
+from hr_breaker.services.embeddings import (
+    HashingEmbeddingBackend,
+    LiteLLMEmbeddingBackend,
+    get_embedding_backend,
+)
+
+JOB = "Backend engineer: Python, Django, PostgreSQL, REST APIs, Kubernetes"
+RELATED = "Built REST APIs in Python and Django on PostgreSQL, deployed to Kubernetes"
+UNRELATED = "Pastry chef: laminated doughs, sourdough, plated desserts and menu costing"
+
+
+def test_backend_selected_from_settings(monkeypatch):
+    monkeypatch.setattr(get_settings(), "embedding_backend", "local")
+    backend = get_embedding_backend()
+    assert isinstance(backend, HashingEmbeddingBackend)
+    assert get_embedding_backend() is backend
+
+    monkeypatch.setattr(get_settings(), "embedding_backend", "litellm")
+    assert isinstance(get_embedding_backend(), LiteLLMEmbeddingBackend)
+
+
+@pytest.mark.asyncio
+async def test_hashing_backend_vectors():
+    backend = HashingEmbeddingBackend(256)
+    vectors = await backend.embed([JOB, RELATED, UNRELATED])
+    assert vectors.shape == (3, 256) and vectors.dtype == np.float32
+    assert vectors.flags["C_CONTIGUOUS"]
+
+    job, related, unrelated = vectors
+    assert np.linalg.norm(job) == pytest.approx(1.0)
+    assert job @ related > job @ unrelated
+    np.testing.assert_array_equal(backend.embed_sync([JOB]), backend.embed_sync([JOB]))
+
+
+async def _evaluate_local(resume_text: str):
+    job = JobPosting(title="Backend engineer", company="Acme", description=JOB)
+    source = ResumeSource(content=resume_text)
+    optimized = OptimizedResume(
+        html="<p></p>", pdf_text=resume_text, source_checksum=source.checksum
+    )
+    return await VectorSimilarityMatcher().evaluate(optimized, job, source)
+
+
+@pytest.mark.asyncio
+async def test_matcher_with_local_backend_makes_no_api_calls(monkeypatch):
+    monkeypatch.setattr(get_settings(), "embedding_backend", "local")
+    aembedding = AsyncMock()
+    with patch("hr_breaker.services.embeddings.litellm_aembedding", aembedding):
+        result = await _evaluate_local(RELATED)
+
+    aembedding.assert_not_called()
+    assert result.passed
+    assert 0.0 < result.score < 1.0
+    assert not any("error" in issue for issue in result.issues)
+
+
+@pytest.mark.asyncio
+async def test_matcher_with_local_backend_rejects_unrelated_resume(monkeypatch):
+    # Non-negative vectors: raw cosine is the score, no (s + 1) / 2 floor at 0.5
+    monkeypatch.setattr(get_settings(), "embedding_backend", "local")
+    monkeypatch.setattr(get_settings(), "filter_vector_threshold", 0.4)
+    result = await _evaluate_local(UNRELATED)
+
+    assert not result.passed
+    assert result.score < 0.4
+    assert "Low semantic vector similarity" in result.issues[0]
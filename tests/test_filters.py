@@ -1,7 +1,27 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
-from hr_breaker.filters import HallucinationChecker, FilterRegistry, KeywordMatcher
-from hr_breaker.models import JobPosting, OptimizedResume, ResumeSource
+from hr_breaker.filters import (
+    ContentLengthChecker,
+    HallucinationChecker,
+    FilterRegistry,
+    FilterResultCache,
+    KeywordMatcher,
+)
+from hr_breaker.filters.content_length import page2_overflow_issue
+from hr_breaker.filters.keyword_matcher import (
+    check_keywords,
+    check_keywords_batch,
+    get_job_keyword_profile,
+)
+from hr_breaker.models import (
+    FilterResult,
+    JobPosting,
+    OptimizedResume,
+    RenderMeasurement,
+    ResumeSource,
+)
 
 
 @pytest.fixture
@@ -74,12 +94,107 @@ async def test_keyword_matcher_no_pdf_text(source_resume, job_posting):
     assert "No PDF text available" in result.issues[0]
 
 
+def test_job_keyword_profile_built_once_per_job(job_posting):
+    same_job = job_posting.model_copy()
+    assert get_job_keyword_profile(job_posting) is get_job_keyword_profile(same_job)
+
+    other_job = job_posting.model_copy(update={"requirements": ["Rust"]})
+    assert get_job_keyword_profile(other_job) is not get_job_keyword_profile(job_posting)
+
+
+def test_check_keywords_does_not_refit(job_posting):
+    get_job_keyword_profile(job_posting)
+    with patch("hr_breaker.filters.keyword_matcher.TfidfVectorizer") as vectorizer:
+        result = check_keywords("python and django developer", job_posting)
+    vectorizer.assert_not_called()
+    assert "postgresql" in result.missing_keywords
+    assert "python" not in result.missing_keywords
+
+
+def test_job_keyword_profile_matches_whole_words(job_posting):
+    profile = get_job_keyword_profile(job_posting)
+    assert "api" in profile.keywords
+
+    assert "api" in profile.check("rapid prototyping", threshold=0.5).missing_keywords
+    assert "api" not in profile.check("rest api design", threshold=0.5).missing_keywords
+
+
+BATCH_JOBS = [
+    JobPosting(
+        title="Backend Engineer",
+        company="Acme",
+        description="Build REST APIs in Python and Django on PostgreSQL. Python first.",
+        requirements=["Python", "Django", "PostgreSQL"],
+        keywords=["python", "django", "postgresql", "rest", "api"],
+    ),
+    JobPosting(
+        title="Data Engineer",
+        company="Beta",
+        description="Spark, Airflow and Kafka pipelines; data modeling in dbt.",
+        requirements=["Spark", "Kafka"],
+        keywords=["spark", "airflow", "c++", "scala"],
+    ),
+    JobPosting(title="The", company="Stopwords only", keywords=["python"]),
+    JobPosting(
+        title="Frontend Engineer",
+        company="Gamma",
+        description="React, TypeScript, GraphQL. Accessibility and design systems.",
+    ),
+]
+
+
+@pytest.mark.parametrize("max_features", [200, 4])
+def test_check_keywords_batch_matches_single(monkeypatch, max_features):
+    from hr_breaker.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "keyword_tfidf_max_features", max_features)
+    resume = "Python developer: Django REST APIs, Kafka consumers, some React and dbt."
+
+    batch = check_keywords_batch(resume, BATCH_JOBS)
+    single = [check_keywords(resume, job) for job in BATCH_JOBS]
+
+    assert len(batch) == len(BATCH_JOBS)
+    for b, s in zip(batch, single):
+        assert b.score == pytest.approx(s.score)
+        assert b.passed == s.passed
+        assert b.missing_keywords == s.missing_keywords
+
+
+def test_check_keywords_batch_edge_cases():
+    assert check_keywords_batch("python", []) == []
+    [result] = check_keywords_batch("python", [BATCH_JOBS[2]])
+    assert result.score == 1.0 and result.passed
+
+
 def test_filter_registry():
     """Test that filters are registered."""
     names = FilterRegistry.names()
     assert "KeywordMatcher" in names
 
 
+def test_filter_pipeline_built_once_per_config():
+    pipeline = FilterRegistry.pipeline()
+    assert FilterRegistry.pipeline() is pipeline
+    assert FilterRegistry.pipeline(no_shame=True) is not pipeline
+    assert all(f.no_shame for f in FilterRegistry.pipeline(no_shame=True))
+
+    priorities = [f.priority for f in pipeline]
+    assert priorities == sorted(priorities)
+    assert set(pipeline.names) == set(FilterRegistry.names())
+
+
+def test_filter_pipeline_enable_disable():
+    only = FilterRegistry.pipeline(enabled=["KeywordMatcher", "DataValidator"])
+    assert only.names == ["DataValidator", "KeywordMatcher"]
+
+    skipped = FilterRegistry.pipeline(disabled=["KeywordMatcher"])
+    assert "KeywordMatcher" not in skipped.names
+    assert len(skipped) == len(FilterRegistry.names()) - 1
+
+    with pytest.raises(ValueError, match="Unknown filter"):
+        FilterRegistry.pipeline(disabled=["NoSuchFilter"])
+
+
 def test_filter_threshold_property():
     """Test threshold property on filters."""
     matcher = KeywordMatcher()
@@ -100,3 +215,92 @@ def test_filter_priorities_unique():
                 f"Duplicate priority {priority}: {seen[priority]} and {name}"
             )
         seen[priority] = name
+
+
+def test_cache_key_tracks_inputs(source_resume, job_posting):
+    def optimized(html, text="Python Django"):
+        return OptimizedResume(
+            html=html, pdf_text=text, source_checksum=source_resume.checksum
+        )
+
+    checker = HallucinationChecker()
+    key = checker.cache_key(optimized("<p>a</p>"), job_posting, source_resume)
+    assert key == checker.cache_key(optimized("<p>a</p>"), job_posting, source_resume)
+    assert key != checker.cache_key(optimized("<p>b</p>"), job_posting, source_resume)
+    assert key != HallucinationChecker(no_shame=True).cache_key(
+        optimized("<p>a</p>"), job_posting, source_resume
+    )
+
+    # Keyword matching only reads the extracted text
+    matcher = KeywordMatcher()
+    assert matcher.cache_key(
+        optimized("<p>a</p>"), job_posting, source_resume
+    ) == matcher.cache_key(optimized("<b>a</b>"), job_posting, source_resume)
+    assert matcher.cache_key(
+        optimized("<p>a</p>"), job_posting, source_resume
+    ) != matcher.cache_key(optimized("<p>a</p>", "Go"), job_posting, source_resume)
+
+
+def test_filter_result_cache():
+    cache = FilterResultCache(max_entries=2)
+    result = FilterResult(filter_name="F", passed=True, score=0.9)
+
+    assert cache.get("a") is None
+    cache.put("a", result)
+    hit = cache.get("a")
+    assert hit.cached and hit.score == 0.9
+    assert not result.cached
+
+    cache.put("b", result)
+    cache.put("c", result)
+    assert cache.get("a") is None
+    assert len(cache) == 2
+
+    cache.put("t", FilterResult(filter_name="F", passed=False, score=0.0, timed_out=True))
+    assert cache.get("t") is None
+    cache.put("e", FilterResult(filter_name="F", passed=True, score=1.0, errored=True))
+    assert cache.get("e") is None
+    assert cache.stats["hits"] == 1
+
+
+def test_page2_overflow_issue():
+    assert page2_overflow_issue(0) is None
+    assert "content overflow" in page2_overflow_issue(200)
+    assert page2_overflow_issue(5000) is None
+
+
+@pytest.mark.parametrize(
+    "measurement,passed",
+    [
+        (RenderMeasurement(page_count=1, page_chars=[3000]), True),
+        (RenderMeasurement(page_count=2, page_chars=[3000, 150]), False),
+        (RenderMeasurement(page_count=3, page_chars=[3000, 3000, 10]), False),
+    ],
+)
+@pytest.mark.asyncio
+async def test_content_length_checker_uses_layout_measurement(
+    source_resume, job_posting, measurement, passed
+):
+    optimized = OptimizedResume(html="<p>x</p>", source_checksum=source_resume.checksum)
+    renderer = MagicMock()
+    renderer.measure_async = AsyncMock(return_value=measurement)
+
+    with patch("hr_breaker.filters.content_length.get_renderer", return_value=renderer):
+        result = await ContentLengthChecker().evaluate(optimized, job_posting, source_resume)
+
+    assert result.passed is passed
+    renderer.render_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_content_length_checker_reuses_render_artifacts(source_resume, job_posting):
+    artifacts = MagicMock(html="<p>x</p>", page_count=2, page_chars=[3000, 150])
+    optimized = OptimizedResume(
+        html="<p>x</p>", source_checksum=source_resume.checksum, artifacts=artifacts
+    )
+
+    with patch("hr_breaker.filters.content_length.get_renderer") as get_renderer:
+        result = await ContentLengthChecker().evaluate(optimized, job_posting, source_resume)
+
+    assert not result.passed
+    get_renderer.assert_not_called()
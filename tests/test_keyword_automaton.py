@@ -0,0 +1,63 @@
+"""Tests for the Aho-Corasick keyword matcher - parity with per-keyword regex."""
+
+import random
+import re
+
+import pytest
+
+from hr_breaker.utils.keyword_automaton import KeywordAutomaton
+
+
+def _regex_find(keywords, text):
+    return {kw for kw in keywords if re.search(rf"\b{re.escape(kw)}\b", text)}
+
+
+KEYWORDS = [
+    "python", "rest", "rest api", "api", "c++", "c#", ".net", "node.js", "go",
+    "ci/cd", "k8s", "machine learning", "learning", "sql", "postgresql", "a",
+    "data", "big data", "s3", "_private", "résumé", "e-commerce",
+]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "python developer with rest api experience",
+        "restful apis and rapid prototyping",
+        "c++ and c# and .net and node.js",
+        "c++17, c#10 and asp.net core",
+        "go, golang, ci/cd pipelines on k8s",
+        "machine learning and deep learning on big data",
+        "postgresql, mysql, nosql",
+        "a/b testing, s3 buckets, __private__ _private",
+        "résumé writing for e-commerce sites; ecommerce",
+        "",
+        "python",
+        "pythonpython python_ python-",
+    ],
+)
+def test_matches_regex_word_boundaries(text):
+    automaton = KeywordAutomaton(KEYWORDS)
+    assert automaton.find(text) == _regex_find(KEYWORDS, text)
+
+
+def test_randomized_parity():
+    rng = random.Random(42)
+    alphabet = "abc +#._-/é1 "
+    keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(60)]
+    automaton = KeywordAutomaton(keywords)
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+        assert automaton.find(text) == _regex_find(set(keywords) - {""}, text), text
+
+
+def test_overlapping_and_nested_keywords():
+    automaton = KeywordAutomaton(["he", "she", "his", "hers", "her"])
+    assert automaton.find("ushers") == set()
+    assert automaton.find("she said hers") == {"she", "hers"}
+
+
+def test_empty_and_duplicate_keywords():
+    automaton = KeywordAutomaton(["", "go", "go"])
+    assert automaton.keywords == ("go",)
+    assert automaton.find("go go") == {"go"}
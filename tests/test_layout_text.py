@@ -0,0 +1,99 @@
+"""Parity tests: layout-tree text extraction vs PyMuPDF on the rendered PDF."""
+
+import unicodedata
+
+import fitz
+import pytest
+
+from hr_breaker.services.layout_text import document_page_texts
+from hr_breaker.services.renderer import HTMLRenderer, RenderCache, RenderError
+
+try:
+    _renderer = HTMLRenderer(cache=RenderCache(max_entries=0))
+except RenderError:  # WeasyPrint system libraries (Pango) not installed
+    _renderer = None
+
+pytestmark = pytest.mark.skipif(_renderer is None, reason="WeasyPrint unavailable")
+
+
+HEADER = """
+<header class="header">
+  <h1 class="name">Jane Smith</h1>
+  <div class="contact-line">jane@example.com<span class="sep">|</span>
+  <a href="https://github.com/janesmith">github.com/janesmith</a></div>
+</header>
+"""
+
+ENTRY = """
+<div class="entry">
+  <div class="entry-header">
+    <div class="entry-main"><span class="company">Tech Corp {i}</span>,
+    <span class="title">Senior Engineer</span></div>
+    <div class="entry-date">2019 - 2023</div>
+  </div>
+  <ul class="bullets">
+    <li>Designed a <strong>streaming</strong> ingestion service handling 2M events/min</li>
+    <li>Reduced p99 API latency from 800ms to 120ms by reworking PostgreSQL indexes,
+    caching hot queries and moving report generation to background workers</li>
+  </ul>
+</div>
+"""
+
+SKILLS = """
+<section class="section">
+  <h2 class="section-title">Skills</h2>
+  <p class="skills-list">Python, Go, C++, PostgreSQL, Kafka, Kubernetes, Terraform</p>
+</section>
+"""
+
+SAMPLES = {
+    "header": HEADER,
+    "entries": HEADER + "".join(ENTRY.format(i=i) for i in range(3)),
+    "skills": HEADER + SKILLS,
+    "two_pages": HEADER + "".join(ENTRY.format(i=i) for i in range(14)) + SKILLS,
+}
+
+
+def _normalize(text: str) -> list[str]:
+    return [
+        " ".join(unicodedata.normalize("NFKC", line).split())
+        for line in text.splitlines()
+        if line.strip()
+    ]
+
+
+def _render_both(html_body: str) -> tuple[list[str], list[str]]:
+    doc = _renderer._layout(html_body)
+    layout_texts = document_page_texts(doc)
+    pdf = fitz.open(stream=doc.write_pdf(), filetype="pdf")
+    try:
+        pdf_texts = [page.get_text() for page in pdf]
+    finally:
+        pdf.close()
+    return layout_texts, pdf_texts
+
+
+@pytest.mark.parametrize("name", SAMPLES)
+def test_same_words_in_same_order(name):
+    layout_texts, pdf_texts = _render_both(SAMPLES[name])
+
+    assert len(layout_texts) == len(pdf_texts)
+    for layout, pdf in zip(layout_texts, pdf_texts):
+        assert " ".join(_normalize(layout)).split() == " ".join(_normalize(pdf)).split()
+
+
+def test_header_lines_match():
+    layout_texts, pdf_texts = _render_both(HEADER)
+    assert _normalize(layout_texts[0]) == _normalize(pdf_texts[0])
+
+
+def test_page_chars_close_to_pdf():
+    layout_texts, pdf_texts = _render_both(SAMPLES["two_pages"])
+    for layout, pdf in zip(layout_texts, pdf_texts):
+        assert abs(len(layout.strip()) - len(pdf.strip())) <= max(10, len(pdf) // 50)
+
+
+def test_render_result_carries_page_texts():
+    result = _renderer.render(SAMPLES["entries"])
+    assert len(result.page_texts) == result.page_count
+    assert "Tech Corp 0" in result.page_texts[0]
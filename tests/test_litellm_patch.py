@@ -5,6 +5,7 @@ import base64
 import pytest
 from pydantic_ai.messages import (
     BinaryContent,
+    CachePoint,
     ImageUrl,
     ModelRequest,
     ModelResponse,
@@ -14,7 +15,12 @@ from pydantic_ai.messages import (
     UserPromptPart,
 )
 
-from hr_breaker.litellm_patch import _convert_user_content, _patched_map_messages
+from hr_breaker.litellm_patch import (
+    _DataUriCache,
+    _convert_user_content,
+    _data_uri_cache,
+    _patched_map_messages,
+)
 
 
 class TestConvertUserContent:
@@ -68,6 +74,73 @@ class TestConvertUserContent:
         ]
 
 
+    def test_cache_point_marks_preceding_part(self):
+        result = _convert_user_content(["static prefix", CachePoint(), "dynamic"])
+        assert result == [
+            {
+                "type": "text",
+                "text": "static prefix",
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": "dynamic"},
+        ]
+
+    def test_cache_point_ttl_and_leading_marker(self):
+        result = _convert_user_content([CachePoint(), "a", CachePoint(ttl="1h")])
+        assert result == [
+            {
+                "type": "text",
+                "text": "a",
+                "cache_control": {"type": "ephemeral", "ttl": "1h"},
+            },
+        ]
+
+
+class TestDataUriCache:
+    def test_replayed_image_encoded_once(self):
+        _data_uri_cache.clear()
+        image = BinaryContent(data=b"\x89PNG replayed", media_type="image/png")
+
+        first = _convert_user_content([image])
+        for _ in range(5):
+            assert _convert_user_content([image]) == first
+        assert _data_uri_cache.encodes == 1
+
+    def test_equal_content_shares_entry(self):
+        cache = _DataUriCache(max_entries=4, max_bytes=1 << 20)
+        a = BinaryContent(data=b"same", media_type="image/png")
+        b = BinaryContent(data=b"same", media_type="image/png")
+
+        assert cache.get(a) == cache.get(b)
+        assert cache.encodes == 1
+        assert len(cache) == 1
+
+    def test_media_type_is_part_of_key(self):
+        cache = _DataUriCache(max_entries=4, max_bytes=1 << 20)
+        png = cache.get(BinaryContent(data=b"same", media_type="image/png"))
+        jpeg = cache.get(BinaryContent(data=b"same", media_type="image/jpeg"))
+        assert png.startswith("data:image/png;")
+        assert jpeg.startswith("data:image/jpeg;")
+
+    def test_bounded_by_entries_and_bytes(self):
+        cache = _DataUriCache(max_entries=2, max_bytes=1 << 20)
+        for i in range(5):
+            cache.get(BinaryContent(data=bytes([i]) * 10, media_type="image/png"))
+        assert len(cache) == 2
+
+        cache = _DataUriCache(max_entries=10, max_bytes=400)
+        for i in range(5):
+            cache.get(BinaryContent(data=bytes([i]) * 100, media_type="image/png"))
+        assert len(cache) == 2
+
+    def test_dead_objects_are_forgotten(self):
+        cache = _DataUriCache(max_entries=4, max_bytes=1 << 20)
+        image = BinaryContent(data=b"short-lived", media_type="image/png")
+        cache.get(image)
+        del image
+        assert cache._by_id == {}
+
+
 class TestPatchedMapMessages:
     @pytest.mark.asyncio
     async def test_system_and_user_text(self):
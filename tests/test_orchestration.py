@@ -1,8 +1,13 @@
 """Tests for orchestration module."""
 
+import asyncio
+
+import numpy as np
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
+from hr_breaker.config import get_settings
+from hr_breaker.filters import FilterPipeline, FilterResultCache, VectorSimilarityMatcher
 from hr_breaker.models import (
     FilterResult,
     JobPosting,
@@ -90,6 +95,240 @@ class TestRunFiltersParallel:
             assert good_results[0].passed
 
 
+def _fake_filter(name, priority, cost_class, passed=True, delay=0.0, log=None):
+    class FakeFilter:
+        def __init__(self, **kwargs):
+            pass
+
+        async def evaluate(self, *args, **kwargs):
+            if log is not None:
+                log.append(f"start:{name}")
+            if delay:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    if log is not None:
+                        log.append(f"cancelled:{name}")
+                    raise
+            if isinstance(passed, Exception):
+                raise passed
+            return FilterResult(
+                filter_name=name,
+                passed=passed,
+                score=1.0 if passed else 0.0,
+                threshold=0.5,
+            )
+
+    FakeFilter.name = name
+    FakeFilter.priority = priority
+    FakeFilter.cost_class = cost_class
+    return FakeFilter
+
+
+class TestRunFiltersSpeculative:
+    async def _run(self, filters, optimized_resume, job_posting, source_resume):
+        with patch("hr_breaker.orchestration.FilterRegistry.all", return_value=filters):
+            return await run_filters(
+                optimized_resume, job_posting, source_resume, speculative=True
+            )
+
+    async def test_all_pass_returns_results_in_priority_order(
+        self, source_resume, job_posting, optimized_resume
+    ):
+        filters = [
+            _fake_filter("Remote", 5, "remote", delay=0.01),
+            _fake_filter("Local", 1, "local"),
+            _fake_filter("Final", 100, "remote"),
+        ]
+        validation = await self._run(filters, optimized_resume, job_posting, source_resume)
+        assert [r.filter_name for r in validation.results] == ["Local", "Remote", "Final"]
+        assert validation.passed
+
+    async def test_sync_local_failure_never_starts_remote(
+        self, source_resume, job_posting, optimized_resume
+    ):
+        log = []
+        filters = [
+            _fake_filter("Validator", 1, "local", passed=False, log=log),
+            _fake_filter("LLM", 5, "remote", delay=1.0, log=log),
+        ]
+        validation = await self._run(filters, optimized_resume, job_posting, source_resume)
+        assert [r.filter_name for r in validation.results] == ["Validator"]
+        assert log == ["start:Validator"]
+
+    async def test_failure_cancels_in_flight_remote_filters(
+        self, source_resume, job_posting, optimized_resume
+    ):
+        log = []
+        filters = [
+            _fake_filter("Local", 1, "local", log=log),
+            _fake_filter("FastFail", 3, "remote", passed=False, delay=0.01, log=log),
+            _fake_filter("Slow", 5, "remote", delay=5.0, log=log),
+            _fake_filter("Final", 100, "remote", log=log),
+        ]
+        start = asyncio.get_running_loop().time()
+        validation = await self._run(filters, optimized_resume, job_posting, source_resume)
+        assert asyncio.get_running_loop().time() - start < 1.0
+        assert [r.filter_name for r in validation.results] == ["Local", "FastFail"]
+        assert "cancelled:Slow" in log
+        assert "start:Final" not in log
+
+    async def test_exception_becomes_failed_result(
+        self, source_resume, job_posting, optimized_resume
+    ):
+        filters = [
+            _fake_filter("Local", 1, "local"),
+            _fake_filter("Broken", 5, "remote", passed=RuntimeError("boom")),
+        ]
+        validation = await self._run(filters, optimized_resume, job_posting, source_resume)
+        broken = validation.results[-1]
+        assert broken.filter_name == "Broken"
+        assert not broken.passed
+        assert "RuntimeError: boom" in broken.issues[0]
+
+
+class TestRunFiltersTimeouts:
+    async def _run(self, filters, optimized_resume, job_posting, source_resume, **kwargs):
+        with patch("hr_breaker.orchestration.FilterRegistry.all", return_value=filters):
+            return await run_filters(
+                optimized_resume, job_posting, source_resume, **kwargs
+            )
+
+    @pytest.mark.parametrize(
+        "mode", [{}, {"parallel": True}, {"speculative": True}]
+    )
+    async def test_straggler_recorded_as_timeout(
+        self, mode, source_resume, job_posting, optimized_resume
+    ):
+        slow = _fake_filter("Slow", 5, "remote", delay=5.0)
+        slow.timeout = 0.05
+        filters = [_fake_filter("Local", 1, "local"), slow]
+
+        start = asyncio.get_running_loop().time()
+        validation = await self._run(
+            filters, optimized_resume, job_posting, source_resume, **mode
+        )
+        assert asyncio.get_running_loop().time() - start < 1.0
+
+        timed_out = validation.results[-1]
+        assert timed_out.filter_name == "Slow"
+        assert timed_out.timed_out
+        assert not timed_out.passed
+        assert not validation.passed
+        assert "Slow" not in validation.feedback_text
+
+    async def test_cost_class_default_timeout(
+        self, monkeypatch, source_resume, job_posting, optimized_resume
+    ):
+        monkeypatch.setattr(get_settings(), "filter_timeout_remote", 0.05)
+        filters = [_fake_filter("Slow", 5, "remote", delay=5.0)]
+        validation = await self._run(
+            filters, optimized_resume, job_posting, source_resume, parallel=True
+        )
+        assert validation.results[0].timed_out
+
+    async def test_latency_budget_caps_the_run(
+        self, source_resume, job_posting, optimized_resume
+    ):
+        filters = [
+            _fake_filter("Fast", 1, "remote", delay=0.01),
+            _fake_filter("Slow", 2, "remote", delay=5.0),
+        ]
+        start = asyncio.get_running_loop().time()
+        validation = await self._run(
+            filters, optimized_resume, job_posting, source_resume, latency_budget=0.1
+        )
+        assert asyncio.get_running_loop().time() - start < 1.0
+        assert [(r.filter_name, r.timed_out) for r in validation.results] == [
+            ("Fast", False),
+            ("Slow", True),
+        ]
+
+    async def test_timeout_error_raised_by_filter_is_not_a_timeout(
+        self, source_resume, job_posting, optimized_resume
+    ):
+        filters = [_fake_filter("Broken", 1, "remote", passed=TimeoutError("upstream"))]
+        validation = await self._run(
+            filters, optimized_resume, job_posting, source_resume, parallel=True
+        )
+        assert not validation.results[0].timed_out
+        assert "TimeoutError: upstream" in validation.results[0].issues[0]
+
+
+async def test_empty_pipeline_runs_no_filters(
+    source_resume, job_posting, optimized_resume
+):
+    log = []
+    with patch(
+        "hr_breaker.orchestration.FilterRegistry.all",
+        return_value=[_fake_filter("Judge", 5, "remote", log=log)],
+    ):
+        validation = await run_filters(
+            optimized_resume, job_posting, source_resume, pipeline=FilterPipeline(())
+        )
+    assert validation.results == []
+    assert log == []
+
+
+class TestRunFiltersCache:
+    @pytest.mark.parametrize(
+        "mode", [{}, {"parallel": True}, {"speculative": True}]
+    )
+    async def test_unchanged_inputs_are_not_reevaluated(
+        self, mode, source_resume, job_posting, optimized_resume
+    ):
+        log = []
+        calls = _fake_filter("Judge", 5, "remote", log=log)
+        calls.cache_key = lambda self, optimized, job, source: optimized.html
+        cache = FilterResultCache()
+
+        with patch("hr_breaker.orchestration.FilterRegistry.all", return_value=[calls]):
+            first = await run_filters(
+                optimized_resume, job_posting, source_resume, cache=cache, **mode
+            )
+            second = await run_filters(
+                optimized_resume.model_copy(), job_posting, source_resume, cache=cache, **mode
+            )
+            changed = optimized_resume.model_copy(update={"html": "<div>Other</div>"})
+            third = await run_filters(
+                changed, job_posting, source_resume, cache=cache, **mode
+            )
+
+        assert log == ["start:Judge", "start:Judge"]
+        assert not first.results[0].cached
+        assert second.results[0].cached
+        assert not third.results[0].cached
+
+    async def test_embedding_outage_is_not_cached(
+        self, source_resume, job_posting, optimized_resume
+    ):
+        backend = MagicMock()
+        backend.non_negative = True
+        backend.embed = AsyncMock(
+            side_effect=[RuntimeError("503"), np.array([[1.0, 0.0], [0.0, 1.0]])]
+        )
+        cache = FilterResultCache()
+
+        with patch(
+            "hr_breaker.orchestration.FilterRegistry.all",
+            return_value=[VectorSimilarityMatcher],
+        ), patch(
+            "hr_breaker.filters.vector_similarity_matcher.get_embedding_backend",
+            return_value=backend,
+        ):
+            outage = await run_filters(
+                optimized_resume, job_posting, source_resume, cache=cache
+            )
+            retried = await run_filters(
+                optimized_resume, job_posting, source_resume, cache=cache
+            )
+
+        assert outage.results[0].passed and outage.results[0].errored
+        assert not retried.results[0].cached
+        assert not retried.results[0].passed
+        assert backend.embed.await_count == 2
+
+
 class TestOptimizeForJobTranslationGating:
     @pytest.mark.asyncio
     async def test_translate_even_when_validation_fails(self):
@@ -128,3 +367,32 @@ class TestOptimizeForJobTranslationGating:
             await optimize_for_job(source, job=job, language=russian, max_iterations=1)
 
             mock_translate.assert_called_once()
+
+
+class TestOptimizeForJobArtifacts:
+    @pytest.mark.asyncio
+    async def test_parsed_pdf_released_after_filters(self):
+        from hr_breaker.orchestration import optimize_for_job
+
+        source = ResumeSource(content="Test content")
+        job = JobPosting(title="Dev", company="Co")
+        artifacts = MagicMock()
+        rendered = OptimizedResume(
+            html="<div>Test</div>",
+            source_checksum=source.checksum,
+            pdf_text="Test",
+            artifacts=artifacts,
+        )
+
+        with (
+            patch("hr_breaker.orchestration.get_renderer"),
+            patch("hr_breaker.orchestration.optimize_resume", new_callable=AsyncMock) as mock_opt,
+            patch("hr_breaker.orchestration._render_and_extract", new_callable=AsyncMock) as mock_render,
+            patch("hr_breaker.orchestration.run_filters", new_callable=AsyncMock) as mock_filters,
+        ):
+            mock_opt.return_value = rendered
+            mock_render.return_value = rendered
+            mock_filters.return_value = ValidationResult(results=[])
+            await optimize_for_job(source, job=job, max_iterations=1)
+
+        artifacts.close.assert_called_once()
@@ -5,7 +5,12 @@ from pathlib import Path
 
 import pytest
 
-from hr_breaker.services.pdf_parser import extract_text_from_pdf
+from hr_breaker.services.pdf_parser import (
+    extract_text_from_pdf,
+    ingest_resumes,
+    iter_pdf_pages,
+    load_resume_content_from_upload,
+)
 
 
 @pytest.fixture
@@ -48,3 +53,101 @@ def test_extract_text_multipage(tmp_path):
     text = extract_text_from_pdf(pdf_path)
     assert "Page 1 content" in text
     assert "Page 2 content" in text
+
+
+@pytest.fixture
+def three_page_pdf(tmp_path):
+    import fitz
+
+    pdf_path = tmp_path / "three.pdf"
+    doc = fitz.open()
+    for i in range(3):
+        doc.new_page().insert_text((50, 50), f"Page {i + 1} content")
+    doc.save(pdf_path)
+    doc.close()
+    return pdf_path
+
+
+def test_iter_pdf_pages_yields_each_page(three_page_pdf):
+    from_path = list(iter_pdf_pages(three_page_pdf))
+    from_bytes = list(iter_pdf_pages(three_page_pdf.read_bytes()))
+
+    assert from_path == from_bytes
+    assert [t.strip() for t in from_path] == [
+        "Page 1 content",
+        "Page 2 content",
+        "Page 3 content",
+    ]
+
+
+def test_iter_pdf_pages_stops_at_char_budget(three_page_pdf):
+    page_len = len(next(iter_pdf_pages(three_page_pdf)))
+
+    pages = list(iter_pdf_pages(three_page_pdf, max_chars=page_len + 4))
+
+    assert len(pages) == 2
+    assert pages[1] == "Page"
+    assert sum(len(p) for p in pages) == page_len + 4
+
+
+def test_upload_respects_extract_budget(three_page_pdf, monkeypatch):
+    from hr_breaker.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "resume_extract_max_chars", 10)
+    data = memoryview(three_page_pdf.read_bytes())
+    assert load_resume_content_from_upload("cv.pdf", data) == "Page 1 con"
+    assert load_resume_content_from_upload("cv.md", memoryview(b"# Me")) == "# Me"
+
+
+@pytest.fixture
+def resume_dir(tmp_path):
+    """Directory with two PDFs, a markdown file, a broken PDF and an unrelated file."""
+    import fitz
+
+    for name, text in [("alice.pdf", "Alice Python"), ("nested/bob.pdf", "Bob Go")]:
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        doc = fitz.open()
+        doc.new_page().insert_text((50, 50), text)
+        doc.save(path)
+        doc.close()
+    (tmp_path / "carol.md").write_text("# Carol\nRust developer")
+    (tmp_path / "broken.pdf").write_bytes(b"not a pdf")
+    (tmp_path / "photo.jpg").write_bytes(b"\xff\xd8")
+    return tmp_path
+
+
+def _by_name(results):
+    return {Path(r.name).name: r for r in results}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ingest_resumes_directory(resume_dir, workers):
+    results = _by_name(ingest_resumes(resume_dir, workers=workers))
+
+    assert set(results) == {"alice.pdf", "bob.pdf", "carol.md", "broken.pdf"}
+    assert "Alice Python" in results["alice.pdf"].content
+    assert "Bob Go" in results["bob.pdf"].content
+    assert results["carol.md"].content.startswith("# Carol")
+    assert results["broken.pdf"].content is None
+    assert results["broken.pdf"].error
+
+
+def test_ingest_resumes_zip(resume_dir, tmp_path_factory):
+    import zipfile
+
+    archive = tmp_path_factory.mktemp("zips") / "resumes.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(resume_dir / "alice.pdf", "alice.pdf")
+        zf.write(resume_dir / "carol.md", "docs/carol.md")
+        zf.write(resume_dir / "photo.jpg", "photo.jpg")
+
+    results = _by_name(ingest_resumes(archive, workers=2))
+
+    assert set(results) == {"alice.pdf", "carol.md"}
+    assert "Alice Python" in results["alice.pdf"].content
+
+
+def test_ingest_resumes_rejects_plain_file(resume_dir):
+    with pytest.raises(ValueError):
+        list(ingest_resumes(resume_dir / "carol.md"))
@@ -0,0 +1,96 @@
+"""Tests for static-prefix prompts and opt-in cache points."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic_ai.messages import CachePoint
+
+from hr_breaker.agents.hallucination_detector import detect_hallucinations
+from hr_breaker.agents.optimizer import optimize_resume
+from hr_breaker.config import get_settings
+from hr_breaker.models import (
+    FilterResult,
+    IterationContext,
+    JobPosting,
+    OptimizedResume,
+    ResumeSource,
+    ValidationResult,
+)
+from hr_breaker.utils.prompt_cache import cacheable_prompt
+
+
+@pytest.fixture
+def prompt_cache(monkeypatch):
+    monkeypatch.setattr(get_settings(), "prompt_cache", True)
+
+
+@pytest.fixture
+def source():
+    return ResumeSource(content="Jane Doe\nPython developer", instructions="Knows Go")
+
+
+@pytest.fixture
+def job():
+    return JobPosting(
+        title="Engineer", company="Acme", requirements=["Python"], keywords=["python"]
+    )
+
+
+def test_disabled_joins_text():
+    assert cacheable_prompt("a", "b") == "ab"
+    assert cacheable_prompt("a", "b", "img") == ["ab", "img"]
+
+
+def test_enabled_inserts_cache_point(prompt_cache):
+    parts = cacheable_prompt("a", "b", "img")
+    assert parts[0] == "a"
+    assert isinstance(parts[1], CachePoint)
+    assert parts[2:] == ["b", "img"]
+
+
+def _agent_returning(output):
+    agent = MagicMock()
+    agent.run = AsyncMock(return_value=MagicMock(output=output))
+    return agent
+
+
+async def test_optimizer_prefix_is_stable_across_iterations(prompt_cache, source, job):
+    agent = _agent_returning(MagicMock(html="<p>x</p>", changes=[]))
+    validation = ValidationResult(
+        results=[FilterResult(filter_name="KeywordMatcher", passed=False, score=0.1)]
+    )
+    contexts = [
+        IterationContext(iteration=0, original_resume=source.content),
+        IterationContext(
+            iteration=1,
+            original_resume=source.content,
+            last_attempt="<p>first</p>",
+            validation=validation,
+        ),
+    ]
+
+    with patch("hr_breaker.agents.optimizer.get_optimizer_agent", return_value=agent):
+        for context in contexts:
+            await optimize_resume(source, job, context, user_instructions="Stress Python")
+
+    first, second = (call.args[0] for call in agent.run.await_args_list)
+    assert first[0] == second[0]
+    assert "Jane Doe" in first[0] and "Acme" in first[0] and "Stress Python" in first[0]
+    assert isinstance(first[1], CachePoint)
+    assert "<p>first</p>" in second[2] and "<p>first</p>" not in second[0]
+
+
+async def test_hallucination_prefix_holds_original_only(prompt_cache, source):
+    agent = _agent_returning(MagicMock(no_hallucination_score=1.0, concerns=[], reasoning=""))
+    optimized = OptimizedResume(html="<p>optimized</p>", source_checksum=source.checksum)
+
+    with patch(
+        "hr_breaker.agents.hallucination_detector.get_hallucination_agent",
+        return_value=agent,
+    ):
+        await detect_hallucinations(optimized, source)
+
+    prefix, cache_point, rest = agent.run.await_args.args[0]
+    assert "Jane Doe" in prefix and "Knows Go" in prefix
+    assert isinstance(cache_point, CachePoint)
+    assert "<p>optimized</p>" in rest and "<p>optimized</p>" not in prefix
@@ -0,0 +1,186 @@
+"""Tests for render artifact bundle."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fitz
+import pytest
+from pydantic import ValidationError
+
+from hr_breaker.config import Settings, get_settings
+from hr_breaker.models import OptimizedResume, RenderResult
+from hr_breaker.services.pdf_parser import extract_text_from_pdf_bytes
+from hr_breaker.services.render_artifacts import (
+    RenderArtifacts,
+    current_artifacts,
+    ensure_artifacts,
+    rasterize_page,
+    vision_media_type,
+)
+
+
+@pytest.fixture
+def two_page_pdf() -> bytes:
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 50), "John Doe\nPython Developer")
+    doc.new_page().insert_text((50, 50), "Overflow")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def artifacts(two_page_pdf):
+    return RenderArtifacts.from_result(
+        RenderResult(pdf_bytes=two_page_pdf, page_count=2, warnings=["w"])
+    )
+
+
+def test_from_result(artifacts, two_page_pdf):
+    assert artifacts.pdf_bytes == two_page_pdf
+    assert artifacts.page_count == 2
+    assert artifacts.warnings == ["w"]
+
+
+def test_text_matches_pdf_parser(artifacts, two_page_pdf):
+    assert artifacts.text == extract_text_from_pdf_bytes(two_page_pdf)
+    assert artifacts.page_chars == [len("John Doe\nPython Developer"), len("Overflow")]
+
+
+def test_page_image_is_png(artifacts):
+    image = artifacts.page_image()
+    assert image.startswith(b"\x89PNG")
+    assert artifacts.page_image() is image
+
+
+def test_document_opened_once(artifacts):
+    with patch(
+        "hr_breaker.services.render_artifacts.fitz.open", wraps=fitz.open
+    ) as mock_open:
+        artifacts.page_texts
+        artifacts.page_image()
+        artifacts.text
+    assert mock_open.call_count == 1
+
+
+def test_close_keeps_computed_values(artifacts):
+    text = artifacts.text
+    image = artifacts.page_image()
+    artifacts.close()
+    assert artifacts.text == text
+    assert artifacts.page_image() == image
+
+
+def test_close_releases_document_and_reopens_on_demand(artifacts):
+    text = artifacts.text
+    artifacts.close()
+    assert artifacts._doc is None
+    assert artifacts.page_image().startswith(b"\x89PNG")
+    artifacts.close()
+    assert artifacts._doc is None
+    assert artifacts.text == text
+
+
+def test_current_artifacts_ignores_stale_render(artifacts):
+    artifacts.html = "<p>old</p>"
+    optimized = OptimizedResume(html="<p>old</p>", source_checksum="abc", artifacts=artifacts)
+    assert current_artifacts(optimized) is artifacts
+
+    edited = optimized.model_copy(update={"html": "<p>new</p>"})
+    assert current_artifacts(edited) is None
+
+
+@pytest.mark.asyncio
+async def test_ensure_artifacts_reuses_attached_render(artifacts):
+    artifacts.html = "<p>x</p>"
+    optimized = OptimizedResume(html="<p>x</p>", source_checksum="abc", artifacts=artifacts)
+
+    with patch("hr_breaker.services.render_artifacts.get_renderer") as get_renderer:
+        assert await ensure_artifacts(optimized) is artifacts
+    get_renderer.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ensure_artifacts_renders_when_missing(two_page_pdf):
+    optimized = OptimizedResume(html="<p>x</p>", source_checksum="abc")
+    renderer = MagicMock()
+    renderer.render_async = AsyncMock(
+        return_value=RenderResult(pdf_bytes=two_page_pdf, page_count=2)
+    )
+
+    with patch("hr_breaker.services.render_artifacts.get_renderer", return_value=renderer):
+        result = await ensure_artifacts(optimized)
+
+    renderer.render_async.assert_awaited_once_with("<p>x</p>")
+    assert result.page_count == 2
+    assert result.html == "<p>x</p>"
+
+
+@pytest.fixture
+def page(two_page_pdf):
+    doc = fitz.open(stream=two_page_pdf, filetype="pdf")
+    yield doc[0]
+    doc.close()
+
+
+@pytest.mark.parametrize(
+    "fmt,magic",
+    [("png", b"\x89PNG"), ("jpeg", b"\xff\xd8"), ("webp", b"RIFF")],
+)
+def test_rasterize_page_formats(page, fmt, magic):
+    assert rasterize_page(page, fmt=fmt).startswith(magic)
+    assert vision_media_type(fmt) == f"image/{fmt}"
+
+
+def test_rasterize_page_max_dim_caps_size(page):
+    image = rasterize_page(page, fmt="png", dpi=300, max_dim=400)
+    pix = fitz.Pixmap(image)
+    assert max(pix.width, pix.height) <= 400
+
+
+def test_rasterize_page_tiny_max_dim_keeps_one_dpi(page):
+    # int(5 * 72 / 842) would be 0 DPI on A4/Letter; clamped to 1 instead
+    pix = fitz.Pixmap(rasterize_page(page, fmt="png", max_dim=5))
+    assert max(pix.width, pix.height) <= 12
+
+
+@pytest.mark.parametrize(
+    "field,value",
+    [("vision_image_dpi", 0), ("vision_image_quality", 101), ("vision_image_max_dim", -1)],
+)
+def test_vision_image_settings_validated(field, value):
+    with pytest.raises(ValidationError):
+        Settings(**{field: value})
+
+
+def test_rasterize_page_grayscale(page):
+    image = rasterize_page(page, fmt="png", grayscale=True)
+    assert fitz.Pixmap(image).n == 1
+
+
+def test_rasterize_page_rejects_unknown_format(page):
+    with pytest.raises(ValueError):
+        rasterize_page(page, fmt="gif")
+
+
+def test_page_image_follows_settings(artifacts, monkeypatch):
+    monkeypatch.setattr(get_settings(), "vision_image_format", "jpeg")
+    assert artifacts.page_image().startswith(b"\xff\xd8")
+    assert artifacts.page_image_media_type == "image/jpeg"
+
+
+def test_layout_text_mode_skips_pdf_parse(two_page_pdf, monkeypatch):
+    monkeypatch.setattr(get_settings(), "render_text_extraction", "layout")
+    result = RenderResult(
+        pdf_bytes=two_page_pdf, page_count=2, page_texts=["From layout\n", "Page 2\n"]
+    )
+    artifacts = RenderArtifacts.from_result(result)
+
+    with patch("hr_breaker.services.render_artifacts.fitz.open") as mock_open:
+        assert artifacts.text == "From layout\n\nPage 2\n"
+        assert artifacts.page_chars == [11, 6]
+    mock_open.assert_not_called()
+
+
+def test_pdf_text_mode_ignores_layout_text(two_page_pdf):
+    result = RenderResult(pdf_bytes=two_page_pdf, page_count=2, page_texts=["From layout\n"])
+    assert RenderArtifacts.from_result(result).text == extract_text_from_pdf_bytes(two_page_pdf)
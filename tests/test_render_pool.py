@@ -0,0 +1,153 @@
+"""Tests for the async rendering backend."""
+
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from hr_breaker.config import get_settings
+from hr_breaker.models.resume_data import ContactInfo, RenderResult, ResumeData
+from hr_breaker.services.render_pool import RenderPool, get_render_pool
+from hr_breaker.services.renderer import HTMLRenderer, RenderError
+
+
+def _fake_result() -> RenderResult:
+    return RenderResult(pdf_bytes=b"%PDF", page_count=1, warnings=[])
+
+
+class _FakeRenderer:
+    """Stand-in for HTMLRenderer inside worker processes (no WeasyPrint)."""
+
+    def render(self, html_body: str) -> RenderResult:
+        if html_body == "slow":
+            time.sleep(30)
+        if html_body == "hog":
+            chunks = []
+            for _ in range(100):
+                chunks.append(b"x" * (20 * 1024 * 1024))
+                time.sleep(0.01)
+        if html_body == "bad":
+            raise RenderError("bad html")
+        if html_body == "crash":
+            os._exit(1)
+        return RenderResult(pdf_bytes=html_body.encode(), page_count=1)
+
+    def render_data(self, data: ResumeData) -> RenderResult:
+        return self.render(data.contact.name)
+
+
+def _fake_renderer_factory():
+    return _FakeRenderer()
+
+
+@pytest.fixture(scope="module")
+def sandbox_pool():
+    """Two real worker processes running _FakeRenderer, shared by the module."""
+    pool = RenderPool(
+        workers=2,
+        timeout=5,
+        max_pending=4,
+        memory_limit_mb=256,
+        renderer_factory=_fake_renderer_factory,
+    )
+    pool.warm_up()
+    yield pool
+    pool.shutdown()
+
+
+class TestRenderPool:
+    def test_disabled_when_no_workers(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "render_workers", 0)
+        get_render_pool.cache_clear()
+        try:
+            assert get_render_pool() is None
+        finally:
+            get_render_pool.cache_clear()
+
+    def test_max_pending_defaults_to_twice_workers(self):
+        assert RenderPool(workers=3, timeout=1, max_pending=0).max_pending == 6
+
+    @pytest.mark.asyncio
+    async def test_renders_in_worker(self, sandbox_pool):
+        result = await sandbox_pool.render("<p>x</p>")
+        assert result.pdf_bytes == b"<p>x</p>"
+
+    @pytest.mark.asyncio
+    async def test_render_error_is_forwarded(self, sandbox_pool):
+        with pytest.raises(RenderError, match="^bad html$"):
+            await sandbox_pool.render("bad")
+        assert (await sandbox_pool.render("ok")).pdf_bytes == b"ok"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_only_that_worker(self, sandbox_pool):
+        sandbox_pool.timeout = 1
+        try:
+            slow = asyncio.create_task(sandbox_pool.render("slow"))
+            await asyncio.sleep(0.1)
+            # The other worker keeps serving while the slow render runs
+            assert (await sandbox_pool.render("fast")).pdf_bytes == b"fast"
+
+            with pytest.raises(RenderError, match="timed out"):
+                await slow
+            assert len(sandbox_pool._all) == 1
+        finally:
+            sandbox_pool.timeout = 5
+        assert (await sandbox_pool.render("again")).pdf_bytes == b"again"
+
+    @pytest.mark.asyncio
+    async def test_memory_limit(self, sandbox_pool):
+        with pytest.raises(RenderError, match="memory limit of 256 MB"):
+            await sandbox_pool.render("hog")
+        assert (await sandbox_pool.render("ok")).pdf_bytes == b"ok"
+
+    @pytest.mark.asyncio
+    async def test_render_data_is_sandboxed(self, sandbox_pool):
+        data = ResumeData(contact=ContactInfo(name="Jane", email="jane@example.com"))
+        assert (await sandbox_pool.render_data(data)).pdf_bytes == b"Jane"
+
+        slow = ResumeData(contact=ContactInfo(name="slow", email="jane@example.com"))
+        sandbox_pool.timeout = 1
+        try:
+            with pytest.raises(RenderError, match="timed out"):
+                await sandbox_pool.render_data(slow)
+        finally:
+            sandbox_pool.timeout = 5
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_is_replaced(self, sandbox_pool):
+        with pytest.raises(RenderError, match="crashed"):
+            await sandbox_pool.render("crash")
+        assert (await sandbox_pool.render("ok")).pdf_bytes == b"ok"
+
+
+class TestRenderAsync:
+    @pytest.mark.asyncio
+    async def test_renders_in_thread_and_caches(self, stub_renderer):
+        with patch(
+            "hr_breaker.services.render_pool.get_render_pool", return_value=None
+        ), patch.object(
+            HTMLRenderer, "_render_uncached", return_value=_fake_result()
+        ) as mock_render:
+            first = await stub_renderer.render_async("<p>x</p>")
+            second = await stub_renderer.render_async("<p>x</p>")
+
+        assert first.pdf_bytes == b"%PDF"
+        assert second is first
+        mock_render.assert_called_once_with("<p>x</p>")
+        assert stub_renderer.cache.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_render_data_goes_through_pool_and_caches(self, stub_renderer):
+        data = ResumeData(contact=ContactInfo(name="Jane", email="jane@example.com"))
+        pool = AsyncMock()
+        pool.run.return_value = _fake_result()
+        with patch(
+            "hr_breaker.services.render_pool.get_render_pool", return_value=pool
+        ), patch.object(HTMLRenderer, "_data_document", return_value="<p>Jane</p>"):
+            first = await stub_renderer.render_data_async(data)
+            second = await stub_renderer.render_data_async(data)
+
+        assert second is first
+        pool.run.assert_awaited_once_with("render_data", data)
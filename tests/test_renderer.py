@@ -1,9 +1,13 @@
 """Tests for the renderer module."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 
 from hr_breaker.models.resume_data import (
     ResumeData,
+    RenderMeasurement,
     RenderResult,
     ContactInfo,
     Experience,
@@ -13,6 +17,7 @@ from hr_breaker.models.resume_data import (
 from hr_breaker.services.renderer import (
     BaseRenderer,
     HTMLRenderer,
+    RenderCache,
     RenderError,
     get_renderer,
 )
@@ -140,6 +145,152 @@ class TestRenderResult:
         assert len(result.warnings) == 1
 
 
+# --- RenderCache Tests ---
+
+
+def _result(n: int = 1) -> RenderResult:
+    return RenderResult(pdf_bytes=b"%PDF-" + bytes([n]), page_count=n, warnings=[])
+
+
+class TestRenderCache:
+    def test_key_depends_on_content_and_template_version(self):
+        key = RenderCache.make_key("<p>a</p>", "v1")
+        assert key == RenderCache.make_key("<p>a</p>", "v1")
+        assert key != RenderCache.make_key("<p>b</p>", "v1")
+        assert key != RenderCache.make_key("<p>a</p>", "v2")
+
+    def test_miss_then_hit(self):
+        cache = RenderCache(max_entries=4)
+        assert cache.get("k") is None
+        cache.put("k", _result())
+        assert cache.get("k").page_count == 1
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = RenderCache(max_entries=2)
+        cache.put("a", _result(1))
+        cache.put("b", _result(2))
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", _result(3))
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_zero_entries_disables_memory_tier(self):
+        cache = RenderCache(max_entries=0)
+        cache.put("k", _result())
+        assert cache.get("k") is None
+
+    def test_disk_tier_survives_new_instance(self, tmp_path):
+        cache = RenderCache(max_entries=4, disk_dir=tmp_path)
+        cache.put("k", RenderResult(pdf_bytes=b"%PDF", page_count=2, warnings=["w"]))
+
+        fresh = RenderCache(max_entries=4, disk_dir=tmp_path)
+        result = fresh.get("k")
+        assert result is not None
+        assert result.pdf_bytes == b"%PDF"
+        assert result.page_count == 2
+        assert result.warnings == ["w"]
+        assert fresh.stats["hits"] == 1
+
+    def test_disk_tier_pruned_oldest_first_over_cap(self, tmp_path):
+        cache = RenderCache(max_entries=0, disk_dir=tmp_path, disk_max_bytes=13_000)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, RenderResult(pdf_bytes=b"x" * 4000, page_count=1, warnings=[]))
+            os.utime(tmp_path / f"{key}.json", (i, i))
+        cache.put("d", RenderResult(pdf_bytes=b"x" * 4000, page_count=1, warnings=[]))
+
+        assert sorted(p.stem for p in tmp_path.glob("*.pdf")) == ["b", "c", "d"]
+        assert not (tmp_path / "a.json").exists()
+        assert cache.get("d") is not None
+
+    def test_disk_tier_hit_refreshes_recency(self, tmp_path):
+        cache = RenderCache(max_entries=0, disk_dir=tmp_path, disk_max_bytes=10_000)
+        for i, key in enumerate(["a", "b"]):
+            cache.put(key, RenderResult(pdf_bytes=b"x" * 4000, page_count=1, warnings=[]))
+            os.utime(tmp_path / f"{key}.json", (i, i))
+        assert cache.get("a") is not None  # "b" is now the oldest
+        cache.put("c", RenderResult(pdf_bytes=b"x" * 4000, page_count=1, warnings=[]))
+
+        assert sorted(p.stem for p in tmp_path.glob("*.pdf")) == ["a", "c"]
+
+    def test_disk_tier_ignores_corrupt_entry(self, tmp_path):
+        (tmp_path / "k.pdf").write_bytes(b"%PDF")
+        (tmp_path / "k.json").write_text("{broken")
+        cache = RenderCache(max_entries=4, disk_dir=tmp_path)
+        assert cache.get("k") is None
+
+
+# --- Wrapper stylesheet Tests ---
+
+
+def test_wrapper_css_split_from_template():
+    """The wrapper's <style> is parsed once; the per-render shell keeps only markup."""
+    from hr_breaker.services.renderer import TEMPLATE_DIR, _STYLE_RE
+
+    wrapper = (TEMPLATE_DIR / "resume_wrapper.html").read_text(encoding="utf-8")
+    css = "\n".join(_STYLE_RE.findall(wrapper))
+    shell = _STYLE_RE.sub("", wrapper)
+
+    assert "@page" in css
+    assert ".section-title" in css
+    assert "<style" not in shell
+    assert "{{BODY}}" in shell
+
+
+# --- HTMLRenderer.measure Tests ---
+
+
+class TestMeasure:
+    def test_measure_skips_pdf_and_caches(self, stub_renderer):
+        measurement = RenderMeasurement(page_count=2, page_chars=[3000, 120])
+        with patch.object(
+            HTMLRenderer, "_measure_uncached", return_value=measurement
+        ) as mock_measure, patch.object(HTMLRenderer, "_render_uncached") as mock_render:
+            assert stub_renderer.measure("<p>x</p>") == measurement
+            assert stub_renderer.measure("<p>x</p>") == measurement
+
+        mock_measure.assert_called_once()
+        mock_render.assert_not_called()
+
+    def test_measure_reuses_full_render(self, stub_renderer):
+        rendered = RenderResult(
+            pdf_bytes=b"%PDF", page_count=1, warnings=[], page_chars=[2500]
+        )
+        with patch.object(HTMLRenderer, "_render_uncached", return_value=rendered), \
+             patch.object(HTMLRenderer, "_measure_uncached") as mock_measure:
+            stub_renderer.render("<p>x</p>")
+            measurement = stub_renderer.measure("<p>x</p>")
+
+        mock_measure.assert_not_called()
+        assert measurement.page_count == 1
+        assert measurement.page_chars == [2500]
+
+    def test_measure_counts_one_lookup(self, stub_renderer, tmp_path):
+        stub_renderer.cache = RenderCache(max_entries=8, disk_dir=tmp_path)
+        measurement = RenderMeasurement(page_count=1, page_chars=[100])
+        with patch.object(
+            HTMLRenderer, "_measure_uncached", return_value=measurement
+        ), patch.object(RenderCache, "_disk_get", return_value=None) as mock_disk:
+            stub_renderer.measure("<p>x</p>")
+            stub_renderer.measure("<p>x</p>")
+
+        assert stub_renderer.cache.stats["misses"] == 1
+        assert stub_renderer.cache.stats["hits"] == 1
+        # Only the full-render key is looked up on disk, once per measure
+        assert mock_disk.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_measure_async_runs_in_thread(self, stub_renderer):
+        measurement = RenderMeasurement(page_count=1, page_chars=[100])
+        with patch(
+            "hr_breaker.services.render_pool.get_render_pool", return_value=None
+        ), patch.object(HTMLRenderer, "_measure_uncached", return_value=measurement):
+            assert await stub_renderer.measure_async("<p>x</p>") == measurement
+
+
 # --- get_renderer Tests ---
 
 
@@ -148,6 +299,18 @@ class TestGetRenderer:
         renderer = get_renderer()
         assert isinstance(renderer, HTMLRenderer)
 
+    def test_shared_across_threads(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from hr_breaker.services import renderer as renderer_module
+
+        monkeypatch.setattr(renderer_module, "_shared_renderer", None)
+        with patch.object(HTMLRenderer, "__init__", lambda self: None):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                renderers = list(pool.map(lambda _: get_renderer(), range(32)))
+
+        assert all(r is renderers[0] for r in renderers)
+
 
 # --- HTMLRenderer Tests ---
 
@@ -0,0 +1,69 @@
+"""Tests for float32 cosine similarity helpers."""
+
+import numpy as np
+import pytest
+
+from hr_breaker.utils.similarity import (
+    EmbeddingIndex,
+    as_matrix,
+    cosine_similarity,
+    similarity_matrix,
+)
+
+
+def _reference_cosine(a, b):
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = sum(x * x for x in a) ** 0.5
+    norm_b = sum(y * y for y in b) ** 0.5
+    return dot / (norm_a * norm_b) if norm_a and norm_b else 0.0
+
+
+def test_cosine_matches_pure_python():
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        a, b = rng.normal(size=(2, 768)).tolist()
+        assert cosine_similarity(a, b) == pytest.approx(_reference_cosine(a, b), abs=1e-5)
+
+
+def test_zero_vector_has_zero_similarity():
+    assert cosine_similarity([0.0, 0.0], [1.0, 2.0]) == 0.0
+
+
+def test_as_matrix_is_contiguous_float32():
+    matrix = as_matrix(np.arange(12, dtype=np.float64).reshape(3, 4)[:, ::2])
+    assert matrix.dtype == np.float32
+    assert matrix.flags["C_CONTIGUOUS"]
+    assert as_matrix([1, 2, 3]).shape == (1, 3)
+
+
+def test_similarity_matrix_matches_pairwise():
+    rng = np.random.default_rng(1)
+    resumes, jobs = rng.normal(size=(5, 64)), rng.normal(size=(7, 64))
+    matrix = similarity_matrix(resumes, jobs)
+
+    assert matrix.shape == (5, 7)
+    for i in range(5):
+        for j in range(7):
+            assert matrix[i, j] == pytest.approx(
+                _reference_cosine(resumes[i], jobs[j]), abs=1e-5
+            )
+
+
+def test_embedding_index_ranks_stored_vectors():
+    index = EmbeddingIndex(["x", "y"], [[1.0, 0.0], [0.0, 1.0]])
+    index.add(["xy"], [[1.0, 1.0]])
+
+    assert len(index) == 3
+    assert [key for key, _ in index.rank([1.0, 0.1])] == ["x", "xy", "y"]
+    assert index.rank([0.0, 2.0], k=1) == [("y", pytest.approx(1.0))]
+    assert index.scores([[1.0, 0.0], [0.0, 1.0]]).shape == (2, 3)
+
+    with pytest.raises(ValueError):
+        index.add(["a", "b"], [[1.0, 0.0]])
+
+
+def test_empty_index():
+    index = EmbeddingIndex()
+    assert index.rank([1.0, 0.0]) == []
+    index.add(["a"], [[3.0, 4.0]])
+    assert index.rank([3.0, 4.0])[0][1] == pytest.approx(1.0)